@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark storage-format conversion (both directions) on large generated handoff documents.
+
+Runs headless; the editor load and read timings are added when a display is available.
+
+Usage: python benchmark.py [lines]
+"""
+import random
+import sys
+import time
+
+from handoff import Block, Document
+
+
+def generate_document(lines):
+    """Build a document of headings, lists and formatted paragraphs"""
+    rng = random.Random(42)
+    bold, italic, underline = frozenset({"bold"}), frozenset({"italic"}), frozenset({"underline"})
+    blocks = []
+
+    for i in range(lines):
+        kind = i % 10
+        if kind == 0:
+            block = Block("h2")
+            block.append(f"{i // 10 + 1}. Active Incidents / Ongoing Issues")
+        elif kind in (1, 2, 3):
+            block = Block("bullet")
+            block.append(f"INC-{10000 + i} circuit ")
+            block.append(f"CID-{rng.randint(1000, 9999)}", bold)
+            block.append(" down since 02:00, vendor ticket raised")
+        elif kind in (4, 5):
+            block = Block("number")
+            block.append("Follow up with ")
+            block.append("NOC shift B", italic)
+            block.append(" on pending maintenance")
+        elif kind == 9:
+            block = Block()
+        else:
+            block = Block()
+            block.append("Outgoing manager notes: ")
+            block.append("link flapping", bold)
+            block.append(" on the core router, ")
+            block.append("monitor closely", bold | underline)
+            block.append(" & escalate if > 3 alerts <30 min>", italic)
+        blocks.append(block)
+
+    return Document(blocks)
+
+
+def time_best(func, repeat=3):
+    """Best wall time of several runs"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark_editor(html):
+    """Time loading into and reading back from the Tk editor, if there is a display"""
+    import tkinter as tk
+    from handoff import RichTextEditor
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"ℹ No display, skipping the editor timings: {e}")
+        return
+    root.withdraw()
+
+    editor = RichTextEditor(root)
+    editor.set_content_from_html(html)
+    print(f"set_content_from_html: {time_best(lambda: editor.set_content_from_html(html)) * 1000:.1f} ms")
+    print(f"get_html_content: {time_best(editor.get_html_content) * 1000:.1f} ms")
+
+    if editor.get_html_content() != html:
+        print("⚠ Round trip through the editor changed the content")
+
+    root.destroy()
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    document = generate_document(lines)
+    html = document.to_storage()
+    parsed = Document.from_storage(html)
+
+    print(f"Document: {lines} lines, {len(html) // 1024} KB of storage HTML")
+    print(f"Document.to_storage: {time_best(document.to_storage) * 1000:.1f} ms")
+    print(f"Document.from_storage: {time_best(lambda: Document.from_storage(html)) * 1000:.1f} ms")
+    print(f"Document.to_editor: {time_best(parsed.to_editor) * 1000:.1f} ms")
+
+    if parsed.to_storage() != html:
+        print("⚠ Round trip through storage format changed the content")
+        return 1
+
+    benchmark_editor(html)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import time
+
+# Start-up timing marks: (label, perf_counter) pairs
+STARTUP_MARKS = [("start", time.perf_counter())]
+
 import requests
+from requests.adapters import HTTPAdapter
 import os
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-from tkhtmlview import HTMLLabel
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, font
 import re
 import urllib3
-import time
 import json
-from datetime import datetime, timedelta
+import random
+import sqlite3
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import webbrowser
+import difflib
+from html import unescape
+from html.parser import HTMLParser
+
+STARTUP_MARKS.append(("imports", time.perf_counter()))
 
 # Load environment variables
 load_dotenv()
@@ -24,15 +39,545 @@ BASE_URL = os.getenv('BASE_URL')
 PAGE_ID = os.getenv('PAGE_ID')
 SPACE_KEY = os.getenv('SPACE_KEY')
 MANAGER_NAME = os.getenv('MANAGER_NAME')
+POOL_SIZE = int(os.getenv('POOL_SIZE', '10'))
+USE_CQL = os.getenv('USE_CQL', 'true').lower() not in ('0', 'false', 'no')
+CACHE_DIR = os.getenv('HANDOFF_CACHE_DIR', os.path.join(os.path.expanduser("~"), ".handoff"))
+INDEX_PATH = os.getenv('INDEX_PATH', os.path.join(CACHE_DIR, f"page_index_{PAGE_ID}.sqlite3"))
+FULL_RECONCILE_HOURS = 12
+CHILD_FETCH_WORKERS = int(os.getenv('CHILD_FETCH_WORKERS', '4'))
+CHILD_PAGE_LIMIT = 500  # servers clamp this to their own maximum
+TYPE_AHEAD_DELAY_MS = 150  # wait for typing to pause before searching
+RESULTS_CHUNK = 200  # result rows inserted at a time as the list scrolls
+BODY_INDEX_DAYS = int(os.getenv('BODY_INDEX_DAYS', '90'))  # page bodies kept searchable, 0 for all
+
+# Expansions requested by fetch_page_content for each fetch profile
+FETCH_PROFILES = {
+    "metadata": "version,space",
+    "storage": "body.storage,version",
+    "view": "body.view,version",
+    "full": "body.storage,version,body.view",
+}
+CONTENT_CACHE_MB = int(os.getenv('CONTENT_CACHE_MB', '32'))
+SNAPSHOT_PATH = os.path.join(CACHE_DIR, f"snapshots_{PAGE_ID}.json")
+QUEUE_PATH = os.path.join(CACHE_DIR, f"write_queue_{PAGE_ID}.jsonl")
+QUEUE_RETRY_SECONDS = 30  # how often queued changes are retried while Confluence is unreachable
+DRAFTS_DIR = os.path.join(CACHE_DIR, f"drafts_{PAGE_ID}")
+BULK_CREATE_WORKERS = int(os.getenv('BULK_CREATE_WORKERS', '4'))  # pages created in parallel
+BULK_CREATE_RATE = float(os.getenv('BULK_CREATE_RATE', '5'))  # page creations started per second
+BULK_REMOVE_WORKERS = int(os.getenv('BULK_REMOVE_WORKERS', '4'))  # pages deleted or archived in parallel
+BULK_RETRIES = 2  # extra attempts for a page whose delete or archive hit a connection problem
+ARCHIVE_PAGE_ID = os.getenv('ARCHIVE_PAGE_ID')  # parent that archived handoffs are moved under
+BULK_MAX_DAYS = 92  # longest date range accepted for bulk creation
+AUTOSAVE_SECONDS = 10  # how often the page being edited is checked for unsaved changes
+DRAFT_MAX_DELTAS = 50  # autosaves appended to a draft before it is rewritten in full
+HEALTH_CHECK_TIMEOUT = (3.05, 5)  # (connect, read) seconds
+REQUEST_RATE = float(os.getenv('REQUEST_RATE', '10'))  # Confluence calls started per second
+REQUEST_BURST = int(os.getenv('REQUEST_BURST', '20'))  # calls that may start back to back after a quiet spell
+REQUEST_RETRIES = 4  # extra attempts for a throttled or failed idempotent call
+RETRY_BACKOFF_MAX = 30  # longest backoff between attempts, in seconds
+RETRY_AFTER_MAX = 120  # a longer Retry-After fails the call instead of waiting
+SLOW_REQUEST_SECONDS = 5  # answers slower than this count as congestion
+METADATA_TIMEOUT = (3.05, 15)  # (connect, read) seconds for searches, listings and version probes
+BODY_TIMEOUT = (3.05, 45)  # (connect, read) seconds for downloading page bodies
+WRITE_TIMEOUT = (3.05, 60)  # (connect, read) seconds for creates, updates, deletes and moves
+REQUEST_DEADLINE = 120  # seconds a call may spend in total, including waits and retries
+CONNECT_TIMEOUT = 300  # give up retrying the start-up connection after this many seconds
+
+# Handoff page titles look like DD-MM-YYYY_Handoff_Manager
+HANDOFF_TITLE_RE = re.compile(r"^(\d{2})-(\d{2})-(\d{4})_Handoff(?:_(.+))?$")
+
+# Closing tags that end a block of storage-format content
+BLOCK_END_RE = re.compile(
+    r"</(?:p|h[1-6]|li|ul|ol|tr|table|div|pre|blockquote|ac:structured-macro)>|<br\s*/?>|<hr\s*/?>",
+    re.IGNORECASE
+)
+
+# Editor tags: inline formatting and their HTML, and line-level block tags
+INLINE_TAGS = {
+    "bold": ("<strong>", "</strong>"),
+    "italic": ("<em>", "</em>"),
+    "underline": ("<u>", "</u>"),
+}
+BLOCK_TAGS = ("h1", "h2", "h3", "bullet", "number")
+LIST_TAGS = {"bullet": "ul", "number": "ol"}
+LIST_MARKER_RE = re.compile(r"(?:•|\d+\.) ?")
+TAG_BATCH_SIZE = 2000  # indices per tag_add call when loading a page
+
+# Message returned by update_page_content when the page changed underneath us
+VERSION_CONFLICT = "Version conflict - please refresh"
+# Message returned by writes that could not reach Confluence at all
+CONNECTION_LOST = "Could not reach Confluence"
+# Message returned by writes that Confluence kept refusing with 429 Too Many Requests
+THROTTLED = "Confluence is busy (too many requests) - please try again in a minute"
+# Message returned by writes abandoned before they were sent (task cancelled or window closed)
+CANCELLED = "Cancelled"
 
 # Disable SSL warnings if needed
 if not VERIFY_SSL:
     urllib3.disable_warnings()
 
+
+def mark_startup(label):
+    """Record the end of a start-up phase"""
+    STARTUP_MARKS.append((label, time.perf_counter()))
+
+
+def startup_report():
+    """One-line summary of time spent in each start-up phase"""
+    phases = [f"{label} {end - begin:.3f}s"
+              for (_, begin), (label, end) in zip(STARTUP_MARKS, STARTUP_MARKS[1:])]
+    total = STARTUP_MARKS[-1][1] - STARTUP_MARKS[0][1]
+    return f"⏱ Startup: {', '.join(phases)} (total {total:.3f}s)"
+
+
+def html_label(parent, **kwargs):
+    """Create a tkhtmlview HTMLLabel, importing tkhtmlview on first use"""
+    from tkhtmlview import HTMLLabel
+    return HTMLLabel(parent, **kwargs)
+
+
+def parse_handoff_title(title):
+    """Split a handoff title into (ISO date, manager), or (None, None)"""
+    match = HANDOFF_TITLE_RE.match(title)
+    if not match:
+        return None, None
+    day, month, year, manager = match.groups()
+    return f"{year}-{month}-{day}", manager
+
+
+def storage_to_text(content):
+    """Plain text of a storage-format body, for full-text indexing"""
+    # Keep code macro bodies, drop every tag
+    text = re.sub(r"<!\[CDATA\[|\]\]>", " ", content)
+    text = re.sub(r"<[^>]*>", " ", text)
+    return re.sub(r"\s+", " ", unescape(text)).strip()
+
+
+def split_storage_blocks(content):
+    """Split storage-format HTML into block-level chunks"""
+    blocks = []
+    start = 0
+    for match in BLOCK_END_RE.finditer(content):
+        block = content[start:match.end()].strip()
+        if block:
+            blocks.append(block)
+        start = match.end()
+    
+    tail = content[start:].strip()
+    if tail:
+        blocks.append(tail)
+    return blocks
+
+
+def handoff_title(page_date, manager_name=""):
+    """Title of the handoff page for a date: DD-MM-YYYY_Handoff_Manager"""
+    title = f"{page_date.strftime('%d-%m-%Y')}_Handoff"
+    return f"{title}_{manager_name}" if manager_name else title
+
+
+def handoff_template(page_date):
+    """Storage-format body of a new handoff page"""
+    return f"""<h1>GNOC Shift Handoff</h1>
+
+<h2>Shift Details:</h2>
+<p><strong>Outgoing Manager:</strong> </p>
+<p><strong>Incoming Manager:</strong> </p>
+<p><strong>Date:</strong> {page_date.strftime("%d %B %Y")}</p>
+<p><strong>Shift Time:</strong> </p>
+
+<h2>1. Active Incidents / Ongoing Issues:</h2>
+<p>&nbsp;</p>
+
+<h2>2. Scheduled Maintenance:</h2>
+<p>&nbsp;</p>
+
+<h2>3. Alerts &amp; Monitoring Anomalies:</h2>
+<p>&nbsp;</p>
+
+<h2>4. Team Resource Status:</h2>
+<p>&nbsp;</p>
+
+<h2>5. Pending Actions / Follow-Ups:</h2>
+<p>&nbsp;</p>
+
+<h2>6. Escalations (If Any):</h2>
+<p>&nbsp;</p>
+
+<h2>7. Other Notes / Announcements:</h2>
+<p>&nbsp;</p>"""
+
+
+def parse_rota(text):
+    """Parse a manager rota: managers who work every day, or one per line with their weekdays.
+    
+    "Alice, Carol" work every day, "Bob: Mon, Wed, Fri" only those days.
+    Returns a list of (manager, set of weekday numbers or None).
+    """
+    weekdays = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+    rota = []
+    for line in text.splitlines():
+        if ":" not in line:
+            rota.extend((name.strip(), None) for name in line.split(",") if name.strip())
+            continue
+        name, _, days = line.partition(":")
+        days = {weekdays.index(day.strip()[:3].lower()) for day in days.split(",")
+                if day.strip()[:3].lower() in weekdays}
+        if name.strip():
+            rota.append((name.strip(), days or None))
+    return rota
+
+
+def plan_rota(start, end, rota):
+    """(title, date) of every handoff page the rota needs between start and end inclusive.
+    
+    A manager listed more than once gets each page only once, in rota order.
+    """
+    plan = []
+    seen = set()
+    day = start
+    while day <= end:
+        for manager_name, days in rota:
+            title = handoff_title(day, manager_name)
+            if (days is None or day.weekday() in days) and title not in seen:
+                seen.add(title)
+                plan.append((title, day))
+        day += timedelta(days=1)
+    return plan
+
+
+class RateLimiter:
+    """Space out calls from several threads to at most rate per second.
+    
+    A token bucket: after a quiet spell up to burst calls may start back
+    to back before the spacing applies again.
+    """
+    
+    def __init__(self, rate, burst=1):
+        self.interval = 1.0 / rate if rate > 0 else 0
+        self.slack = (max(1, burst) - 1) * self.interval
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+    
+    def wait(self, cancel_event=None):
+        """Block until the caller may start its call, or cancel_event is set"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        delay = slot - self.slack - now
+        if delay > 0:
+            if cancel_event:
+                cancel_event.wait(delay)
+            else:
+                time.sleep(delay)
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (seconds or HTTP date), or None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+# Cancel event of the background task running on each worker thread
+cancel_events = threading.local()
+
+
+def current_cancel_event():
+    """The cancel event of the task running on this thread, or None"""
+    return getattr(cancel_events, "event", None)
+
+
+def run_with_cancel_event(cancel_event, func, *args):
+    """Run func(*args) with cancel_event as this thread's cancel event"""
+    previous = current_cancel_event()
+    cancel_events.event = cancel_event
+    try:
+        return func(*args)
+    finally:
+        cancel_events.event = previous
+
+
+def share_cancel_event(func):
+    """Wrap func so the threads of an inner pool see the calling task's cancel event"""
+    cancel_event = current_cancel_event()
+    return lambda *args: run_with_cancel_event(cancel_event, func, *args)
+
+
+class RequestCancelled(Exception):
+    """A call was abandoned because its task was cancelled or the client closed"""
+
+
+def describe_status(response):
+    """A failed response's status code, explained when Confluence is pushing back"""
+    if response.status_code == 429:
+        return "429 (Confluence is busy - too many requests, try again shortly)"
+    if response.status_code == 503:
+        return "503 (Confluence is temporarily unavailable)"
+    return str(response.status_code)
+
+
+class RequestScheduler:
+    """Pace, limit and retry every HTTP call made through a session.
+    
+    Calls start at most rate per second (see RateLimiter) and at most
+    limit of them run at once. The limit grows by one per limit's worth
+    of quick successes and halves on throttling, server errors or slow
+    answers (AIMD), so a busy Confluence sees fewer calls from us. A 429
+    or 503 with Retry-After holds back every call for that long.
+    Idempotent calls are retried with jittered exponential backoff;
+    writes only after a 429, which Confluence sends before doing anything.
+    
+    Every attempt has a (connect, read) timeout and the whole call a
+    deadline. Waits end early with RequestCancelled once the calling
+    task is cancelled (see current_cancel_event) or close() is called;
+    an answer already being read is bounded by its read timeout.
+    """
+    
+    RETRY_STATUSES = (429, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+    
+    def __init__(self, session, rate=REQUEST_RATE, burst=REQUEST_BURST, max_concurrency=10,
+                 min_concurrency=1, retries=REQUEST_RETRIES):
+        self.session = session
+        self.limiter = RateLimiter(rate, burst)
+        self.retries = retries
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max(min_concurrency, max_concurrency)
+        self.limit = float(max(min_concurrency, self.max_concurrency // 2))
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+        self.closed = threading.Event()
+    
+    def close(self):
+        """Abandon every waiting and future call"""
+        self.closed.set()
+        with self.condition:
+            self.condition.notify_all()
+    
+    def check_cancelled(self, cancel_event):
+        """Raise RequestCancelled if the call should be abandoned"""
+        if self.closed.is_set() or (cancel_event and cancel_event.is_set()):
+            raise RequestCancelled("Request cancelled")
+    
+    def acquire(self, cancel_event, give_up):
+        """Wait for a free slot, any Retry-After pause, and a rate token"""
+        with self.condition:
+            while True:
+                self.check_cancelled(cancel_event)
+                now = time.monotonic()
+                if now >= give_up:
+                    raise requests.Timeout("Gave up waiting for a turn to call Confluence")
+                pause = self.paused_until - now
+                if pause > 0:
+                    # Wake up now and then to notice a cancelled task
+                    self.condition.wait(min(pause, 0.5))
+                elif self.in_flight >= int(self.limit):
+                    self.condition.wait(0.5)
+                else:
+                    break
+            self.in_flight += 1
+        self.limiter.wait(cancel_event or self.closed)
+        try:
+            self.check_cancelled(cancel_event)
+        except RequestCancelled:
+            with self.condition:
+                self.in_flight -= 1
+                self.condition.notify_all()
+            raise
+    
+    def release(self, congested):
+        """Free a slot and adjust the concurrency limit"""
+        with self.condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if not congested:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            elif now - self.last_decrease > SLOW_REQUEST_SECONDS:
+                # Calls already in flight report the same congestion; halve once for all of them
+                self.limit = max(self.min_concurrency, self.limit / 2)
+                self.last_decrease = now
+            self.condition.notify_all()
+    
+    def pause(self, seconds):
+        """Hold back every call for seconds"""
+        with self.condition:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.condition.notify_all()
+    
+    def backoff(self, attempt):
+        """Exponential delay before retry attempt + 1, half of it random"""
+        delay = min(RETRY_BACKOFF_MAX, 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    def sleep(self, seconds, cancel_event):
+        """Wait between attempts, raising RequestCancelled if the call is abandoned meanwhile"""
+        end = time.monotonic() + seconds
+        while True:
+            self.check_cancelled(cancel_event)
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return
+            (cancel_event or self.closed).wait(min(remaining, 0.5))
+    
+    def request(self, method, url, retry=True, deadline=REQUEST_DEADLINE, **kwargs):
+        """Send a request, retrying where safe; returns the last response or raises the last error.
+        
+        Without a timeout argument reads use METADATA_TIMEOUT and writes WRITE_TIMEOUT.
+        """
+        idempotent = method in self.IDEMPOTENT_METHODS
+        kwargs.setdefault("timeout", METADATA_TIMEOUT if idempotent else WRITE_TIMEOUT)
+        cancel_event = current_cancel_event()
+        give_up = time.monotonic() + deadline
+        attempt = 0
+        while True:
+            self.acquire(cancel_event, give_up)
+            started = time.monotonic()
+            response = None
+            congested = True
+            try:
+                response = self.session.request(method, url, **kwargs)
+                congested = (response.status_code in self.RETRY_STATUSES
+                             or time.monotonic() - started > SLOW_REQUEST_SECONDS)
+            except requests.RequestException as e:
+                if not (retry and idempotent) or attempt >= self.retries or time.monotonic() >= give_up:
+                    raise
+                reason, delay = type(e).__name__, self.backoff(attempt)
+            finally:
+                # Whatever happened, the slot is free again
+                self.release(congested)
+            
+            if response is not None:
+                status = response.status_code
+                if status not in self.RETRY_STATUSES:
+                    return response
+                
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and status in (429, 503):
+                    self.pause(min(retry_after, RETRY_AFTER_MAX))
+                if (not retry or attempt >= self.retries or (not idempotent and status != 429)
+                        or (retry_after or 0) > RETRY_AFTER_MAX
+                        or time.monotonic() + (retry_after or 0) >= give_up):
+                    return response
+                response.close()
+                # acquire() sits out a Retry-After pause; otherwise back off
+                reason, delay = status, 0 if retry_after is not None else self.backoff(attempt)
+            
+            attempt += 1
+            print(f"⏳ {method} {url.split('?')[0]} got {reason}, retry {attempt}/{self.retries}")
+            if delay:
+                self.sleep(delay, cancel_event)
+
+
+def normalize_storage(content):
+    """Canonical form of storage content, ignoring whitespace and tag spelling differences"""
+    content = re.sub(r"\s+", " ", content.replace("&nbsp;", "\xa0"))
+    content = re.sub(r">\s+<", "><", content)
+    return re.sub(r"<(br|hr)\s*/?>", r"<\1/>", content)
+
+
+def block_changes(old, new):
+    """Block-level diff of two storage bodies.
+    
+    Both bodies are normalized and blocks are compared by hash, so the
+    diff stays fast on large pages. Returns (old blocks, new blocks,
+    opcodes of the changed regions); no opcodes means no real change.
+    """
+    old_blocks = split_storage_blocks(normalize_storage(old))
+    new_blocks = split_storage_blocks(normalize_storage(new))
+    matcher = difflib.SequenceMatcher(
+        None,
+        [hash(block) for block in old_blocks],
+        [hash(block) for block in new_blocks],
+        autojunk=False
+    )
+    return old_blocks, new_blocks, [op for op in matcher.get_opcodes() if op[0] != "equal"]
+
+
+def summarize_changes(old, new, max_sections=8):
+    """Compact per-section description of what changed between two storage bodies.
+    
+    Returns a list of lines, empty if nothing changed.
+    """
+    old_blocks, new_blocks, opcodes = block_changes(old, new)
+    
+    def preview(block):
+        text = storage_to_text(block) or "(blank)"
+        return text if len(text) <= 70 else text[:67] + "..."
+    
+    # Changes are grouped under the heading they follow
+    sections = OrderedDict()
+    for tag, i1, i2, j1, j2 in opcodes:
+        heading = next((preview(block) for block in reversed(old_blocks[:i1])
+                        if re.match(r"<h[1-6]\b", block)), "Top of page")
+        section = sections.setdefault(heading, {"removed": [], "added": []})
+        section["removed"].extend(preview(block) for block in old_blocks[i1:i2])
+        section["added"].extend(preview(block) for block in new_blocks[j1:j2])
+    
+    lines = []
+    for heading, section in list(sections.items())[:max_sections]:
+        lines.append(f"[{heading}] +{len(section['added'])} / -{len(section['removed'])} block(s)")
+        lines.extend(f"    - {text}" for text in section["removed"][:2])
+        lines.extend(f"    + {text}" for text in section["added"][:2])
+    if len(sections) > max_sections:
+        lines.append(f"... and {len(sections) - max_sections} more section(s)")
+    return lines
+
+
+def merge_storage(base, mine, theirs):
+    """Three-way merge of storage content at block level.
+    
+    Returns the merged content, or None if both sides changed the same
+    (or adjacent) blocks in different ways.
+    """
+    base_blocks = split_storage_blocks(base)
+    
+    def changes(other):
+        other_blocks = split_storage_blocks(other)
+        matcher = difflib.SequenceMatcher(None, base_blocks, other_blocks, autojunk=False)
+        return [(i1, i2, other_blocks[j1:j2])
+                for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+    
+    mine_changes = changes(mine)
+    theirs_changes = changes(theirs)
+    
+    merged = []
+    pos = 0
+    while mine_changes or theirs_changes:
+        if not theirs_changes or (mine_changes and mine_changes[0][0] <= theirs_changes[0][0]):
+            change, other = mine_changes.pop(0), theirs_changes
+        else:
+            change, other = theirs_changes.pop(0), mine_changes
+        
+        start, end, replacement = change
+        if other and other[0][0] <= end:
+            # Both sides touched this region; only identical edits merge
+            if other[0] != change:
+                return None
+            other.pop(0)
+        
+        merged.extend(base_blocks[pos:start])
+        merged.extend(replacement)
+        pos = end
+    
+    merged.extend(base_blocks[pos:])
+    return "\n".join(merged)
+
+
 class ConfluenceClient:
     """Handle all Confluence API interactions"""
     
-    def __init__(self, base_url, page_id, pat, verify_ssl=True, space_key=None):
+    def __init__(self, base_url, page_id, pat, verify_ssl=True, space_key=None, pool_size=10,
+                 use_cql=True, index=None, fetch_workers=4, cache_bytes=32 * 1024 * 1024):
         self.base_url = base_url
         self.page_id = page_id
         self.parent_page_id = page_id  # Store as parent page ID
@@ -44,117 +589,488 @@ class ConfluenceClient:
         self.current_version = None
         self.current_content = None
         self.space_key = space_key
+        self.use_cql = use_cql
+        self.index = index
+        self.fetch_workers = max(1, min(fetch_workers, pool_size))
+        self.cache = PageContentCache(cache_bytes)
+        self.titles = TitleIndex()
+        self.sync_lock = threading.Lock()
+        self.body_sync_lock = threading.Lock()
+        self.session = self.create_session(pool_size)
+        self.scheduler = RequestScheduler(self.session, max_concurrency=pool_size)
+    
+    def create_session(self, pool_size):
+        """Create a keep-alive session with a shared connection pool"""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.verify = self.verify_ssl
+        
+        # One pool per host, reused by every call (and every pagination step)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            pool_block=True
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def close(self):
+        """Abandon pending calls and close pooled connections"""
+        self.scheduler.close()
+        self.session.close()
+    
+    def request(self, method, url, **kwargs):
+        """Send a request through the scheduler (see RequestScheduler)"""
+        # Per call, so REQUESTS_CA_BUNDLE / CURL_CA_BUNDLE cannot override VERIFY_SSL=False
+        kwargs.setdefault("verify", self.verify_ssl)
+        return self.scheduler.request(method, url, **kwargs)
+    
+    def check_health(self):
+        """Quick readiness probe against the Confluence instance itself"""
+        url = f"{self.base_url}/status"
+        try:
+            response = self.request("GET", url, timeout=HEALTH_CHECK_TIMEOUT, retry=False, deadline=sum(HEALTH_CHECK_TIMEOUT))
+            # Any answer short of a server error means Confluence is up
+            return response.status_code < 500
+        except Exception:
+            return False
     
     def get_current_user(self):
-        """Get current authenticated user"""
+        """Get current authenticated user.
+        
+        Returns (user, status code); user is None on failure and the
+        status code is None when Confluence could not be reached.
+        """
         url = f"{self.base_url}/rest/api/user/current"
         try:
-            response = requests.get(url, verify=self.verify_ssl, headers=self.headers)
+            response = self.request("GET", url)
             if response.status_code == 200:
-                return response.json()
+                return response.json(), 200
+            print(f"Failed to fetch user. Status: {describe_status(response)}")
+            return None, response.status_code
         except Exception as e:
             print(f"Error fetching user: {e}")
-        return None
+        return None, None
     
     def search_pages_by_title(self, search_term):
         """Search for pages by title within parent page"""
-        url = f"{self.base_url}/rest/api/content/{self.parent_page_id}/child/page"
+        if self.use_cql:
+            pages = self.search_pages_cql(search_term)
+            if pages is not None:
+                return pages
+        
+        # Fallback: download every child page and filter locally
+        all_pages = self.list_child_pages()
+        
+        # Filter pages by search term
+        if search_term:
+            filtered_pages = [p for p in all_pages if search_term.lower() in p['title'].lower()]
+        else:
+            filtered_pages = all_pages
+        
+        return filtered_pages
+    
+    def build_cql(self, search_term=None):
+        """Build a CQL query limited to children of the parent page"""
+        clauses = ["type = page", f"parent = {self.parent_page_id}"]
+        if self.space_key:
+            clauses.append(f'space = "{self.escape_cql(self.space_key)}"')
+        if search_term:
+            term = self.escape_cql(search_term)
+            clauses.append(f'(title ~ "{term}" OR title ~ "{term}*")')
+        return " AND ".join(clauses)
+    
+    def escape_cql(self, value):
+        """Escape a value for use inside a quoted CQL string"""
+        return value.replace('\\', '\\\\').replace('"', '\\"')
+    
+    def search_pages_cql(self, search_term):
+        """Search child pages server-side with CQL.
+        
+        Returns None if CQL is unavailable, or cannot be trusted to have
+        found every match, so the caller can fall back to the child-page
+        listing.
+        """
+        all_pages = self.run_cql(self.build_cql(search_term))
+        if all_pages is None or not search_term:
+            return all_pages
+        
+        # CQL title matching is word based, so keep the substring semantics
+        # of the child-page search on the (much smaller) server result
+        term = search_term.lower()
+        all_pages = [p for p in all_pages if term in p['title'].lower()]
+        
+        # Part of a word (e.g. "ob" for "..._Handoff_Bob") can be missed by
+        # CQL, and an empty answer may be such a miss: only trust results
+        # where every word of the term is a whole word of the title
+        words = [w for w in re.split(r"[\W_]+", term) if w]
+        for page in all_pages:
+            title_words = set(re.split(r"[\W_]+", page['title'].lower()))
+            if not all(word in title_words for word in words):
+                return None
+        return all_pages or None
+    
+    def run_cql(self, cql):
+        """Fetch every page matching a CQL query, or None on failure"""
+        url = f"{self.base_url}/rest/api/content/search"
         
         all_pages = []
         start = 0
-        limit = 25
+        limit = 100
         
         while True:
             params = {
+                "cql": cql,
                 "start": start,
                 "limit": limit,
                 "expand": "version"
             }
             
             try:
-                response = requests.get(url, headers=self.headers, params=params, verify=self.verify_ssl)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('results', [])
-                    all_pages.extend(results)
-                    
-                    if len(results) < limit:
-                        break
-                    start += limit
-                else:
-                    print(f"Failed to fetch child pages. Status: {response.status_code}")
-                    break
+                response = self.request("GET", url, params=params)
+            except RequestCancelled:
+                return None
             except Exception as e:
-                print(f"Error searching pages: {e}")
+                print(f"Error searching pages with CQL: {e}")
+                return None
+            
+            if response.status_code != 200:
+                print(f"CQL search failed. Status: {describe_status(response)}")
+                if response.status_code in (404, 501) or (response.status_code == 400 and not self.cql_supported(cql)):
+                    # CQL search is disabled or unsupported on this instance
+                    self.use_cql = False
+                return None
+            
+            results = response.json().get('results', [])
+            all_pages.extend(results)
+            
+            if len(results) < limit:
                 break
+            start += len(results)
         
-        # Filter pages by search term
-        if search_term:
-            filtered_pages = [p for p in all_pages if search_term.lower() in p['title'].lower()]
-        else:
-            filtered_pages = all_pages
+        return all_pages
+    
+    def cql_supported(self, failed_cql):
+        """Whether CQL works at all after failed_cql got a 400.
         
-        return filtered_pages
+        A 400 can come from the query text itself (e.g. a search term of
+        "*"), so only a rejected parent-only query turns CQL off.
+        """
+        bare_cql = self.build_cql()
+        if failed_cql == bare_cql:
+            return False
+        
+        url = f"{self.base_url}/rest/api/content/search"
+        try:
+            response = self.request("GET", url, params={"cql": bare_cql, "limit": 1})
+        except Exception:
+            return True  # could not tell; keep CQL for now
+        return response.status_code not in (400, 404, 501)
+    
+    def list_child_pages(self, strict=False, max_workers=None):
+        """List every child page of the parent page.
+        
+        The first request asks for CHILD_PAGE_LIMIT items and the reply
+        tells us the page size the server actually allows. The remaining
+        ranges are then fetched max_workers at a time and merged in order
+        until a short range marks the end of the list.
+        
+        With strict=True a failed request returns None instead of the
+        pages fetched so far.
+        """
+        if max_workers is None:
+            max_workers = self.fetch_workers
+        
+        first = self.fetch_child_range(0, CHILD_PAGE_LIMIT)
+        if first is None:
+            return None if strict else []
+        
+        all_pages, limit = first
+        if len(all_pages) < limit:
+            return all_pages
+        
+        start = limit
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while True:
+                starts = [start + i * limit for i in range(max_workers)]
+                for result in pool.map(share_cancel_event(lambda s: self.fetch_child_range(s, limit)), starts):
+                    if result is None:
+                        return None if strict else all_pages
+                    
+                    results, _ = result
+                    all_pages.extend(results)
+                    if len(results) < limit:
+                        return all_pages
+                start += max_workers * limit
+    
+    def fetch_child_range(self, start, limit):
+        """Fetch one range of child pages.
+        
+        Returns (pages, limit honoured by the server), or None on failure.
+        """
+        url = f"{self.base_url}/rest/api/content/{self.parent_page_id}/child/page"
+        params = {
+            "start": start,
+            "limit": limit,
+            "expand": "version"
+        }
+        
+        try:
+            response = self.request("GET", url, params=params)
+            
+            if response.status_code == 200:
+                data = response.json()
+                results = data.get('results', [])
+                return results, data.get('limit', limit)
+            
+            print(f"Failed to fetch child pages. Status: {describe_status(response)}")
+        except RequestCancelled:
+            pass
+        except Exception as e:
+            print(f"Error searching pages: {e}")
+        return None
+    
+    def find_pages(self, search_term):
+        """Search pages, answering from the local index once it is populated"""
+        if self.index and self.index.is_populated():
+            return self.index.search(search_term)
+        
+        pages = self.search_pages_by_title(search_term)
+        if self.index:
+            self.index.upsert_pages(pages)
+            self.refresh_titles()
+        return pages
+    
+    def search_bodies(self, search_term, days=None):
+        """Full-text search of indexed page bodies, optionally only the last days days"""
+        if not self.index:
+            return []
+        return self.index.search_bodies(search_term, days)
+    
+    def sync_bodies(self, days=BODY_INDEX_DAYS):
+        """Index the storage bodies of pages changed since they were last indexed.
+        
+        Only pages from the last days days (all pages for 0) are fetched,
+        newest first, in parallel. The content cache is bypassed so a bulk
+        sync does not evict the pages being worked on. Returns the number
+        of bodies indexed, or None if another body sync is running.
+        """
+        if not self.index:
+            return 0
+        if not self.body_sync_lock.acquire(blocking=False):
+            return None
+        
+        def index_page(page_id):
+            data = self.request_page(page_id, FETCH_PROFILES["storage"])
+            if data is None:
+                return False
+            return self.index.index_body(page_id, data['version']['number'], data['body']['storage']['value'])
+        
+        try:
+            stale = self.index.stale_bodies(days)
+            if not stale:
+                return 0
+            with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+                indexed = sum(executor.map(share_cancel_event(index_page), stale))
+            print(f"🔎 Indexed {indexed} of {len(stale)} page bodies")
+            return indexed
+        finally:
+            self.body_sync_lock.release()
+    
+    def refresh_titles(self):
+        """Reload the in-memory title index from the local page index"""
+        if self.index:
+            # Before the first full listing the index only holds earlier search hits
+            self.titles.build(self.index.search(""), self.index.is_populated())
+        return len(self.titles)
+    
+    def sync_index(self, full=False):
+        """Bring the local page index up to date.
+        
+        Only pages modified since the last sync are fetched. A full listing
+        (which also drops pages deleted on the server) is done on the first
+        sync, when CQL is unavailable, or every FULL_RECONCILE_HOURS.
+        Returns the number of changed index rows, or None if the sync
+        failed or another sync is already running.
+        """
+        if not self.index:
+            return 0
+        if not self.sync_lock.acquire(blocking=False):
+            return None
+        
+        try:
+            started = datetime.now()
+            last_sync = self.index.get_sync_time("last_sync")
+            last_full_sync = self.index.get_sync_time("last_full_sync")
+            
+            if (full or not self.use_cql or last_sync is None or last_full_sync is None
+                    or started - last_full_sync > timedelta(hours=FULL_RECONCILE_HOURS)):
+                pages = self.list_child_pages(strict=True)
+                if pages is None:
+                    return None
+                changed = self.index.replace_pages(pages)
+                self.index.set_sync_time("last_full_sync", started)
+            else:
+                # CQL dates are day-granular in the server's time zone, so
+                # overlap by a day rather than miss an edit
+                since = (last_sync - timedelta(days=1)).strftime("%Y/%m/%d")
+                pages = self.run_cql(f'{self.build_cql()} AND lastmodified >= "{since}"')
+                if pages is None:
+                    return None
+                changed = self.index.upsert_pages(pages)
+            
+            self.index.set_sync_time("last_sync", started)
+            if changed or not self.titles.loaded:
+                self.refresh_titles()
+            return changed
+        finally:
+            self.sync_lock.release()
     
     def get_yesterdays_handoff(self, manager_name=None):
         """Find yesterday's handoff page"""
         yesterday = datetime.now() - timedelta(days=1)
         date_prefix = yesterday.strftime("%d-%m-%Y")
         
-        # Search for pages with yesterday's date
-        all_pages = self.search_pages_by_title(date_prefix)
-        
         # Look for handoff pages with the pattern DD-MM-YYYY_Handoff_Manager
-        handoff_pages = []
-        for page in all_pages:
+        def is_handoff(page):
             # If manager name specified, look for exact match
             if manager_name:
-                pattern = f"{date_prefix}_Handoff_{manager_name}"
-                if page['title'] == pattern:
-                    handoff_pages.append(page)
-            else:
-                # Look for any handoff page
-                if re.match(rf"{date_prefix}_Handoff_\w+", page['title']):
-                    handoff_pages.append(page)
+                return page['title'] == f"{date_prefix}_Handoff_{manager_name}"
+            # Look for any handoff page
+            return re.match(rf"{date_prefix}_Handoff_\w+", page['title']) is not None
+        
+        # Answer from the local index when it already knows the page
+        if self.index:
+            handoff_pages = [p for p in self.index.search(date_prefix) if is_handoff(p)]
+            if handoff_pages:
+                return handoff_pages
+        
+        # The exact title is known, so fetch it directly
+        if manager_name:
+            page = self.get_page_by_title(f"{date_prefix}_Handoff_{manager_name}")
+            return [page] if page else []
+        
+        # Search for pages with yesterday's date
+        all_pages = self.search_pages_by_title(date_prefix)
+        if self.index:
+            self.index.upsert_pages(all_pages)
         
-        return handoff_pages
+        return [p for p in all_pages if is_handoff(p)]
     
-    def fetch_page_content(self, page_id=None):
-        """Fetch page content and version"""
-        if page_id is None:
-            page_id = self.page_id
-            
-        url = f"{self.base_url}/rest/api/content/{page_id}"
-        params = {"expand": "body.storage,version,body.view"}
+    def get_page_by_title(self, title):
+        """Fetch a handoff page (one under the parent page) by its exact title in one round trip"""
+        space_key = self.get_space_key()
+        if not space_key:
+            return None
+        
+        url = f"{self.base_url}/rest/api/content"
+        params = {
+            "type": "page",
+            "spaceKey": space_key,
+            "title": title,
+            "expand": "version,ancestors"
+        }
         
         try:
-            response = requests.get(url, params=params, verify=self.verify_ssl, headers=self.headers)
+            response = self.request("GET", url, params=params)
             if response.status_code == 200:
-                data = response.json()
-                if page_id == self.page_id:
-                    self.current_version = data['version']['number']
-                    self.current_content = data['body']['storage']['value']
-                return data
+                # The lookup covers the whole space; keep only direct children of the parent page
+                results = [page for page in response.json().get('results', [])
+                           if page.get('ancestors') and str(page['ancestors'][-1].get('id')) == str(self.parent_page_id)]
+                if results:
+                    if self.index:
+                        self.index.upsert_pages(results[:1])
+                    return results[0]
             else:
-                print(f"Failed to fetch page: {response.status_code}")
-                return None
+                print(f"Failed to look up page by title. Status: {describe_status(response)}")
         except Exception as e:
-            print(f"Error fetching page: {e}")
-            return None
+            print(f"Error looking up page by title: {e}")
+        return None
     
-    def update_page_content(self, page_id, new_content, title):
-        """Update entire page content"""
-        url = f"{self.base_url}/rest/api/content/{page_id}"
+    def fetch_page_content(self, page_id=None, profile="full"):
+        """Fetch page content and version.
         
-        # Get current page info
-        page_data = self.fetch_page_content(page_id)
-        if not page_data:
-            return False, "Failed to fetch page data"
+        profile picks what is downloaded (see FETCH_PROFILES): "metadata"
+        for version and space only, "storage" or "view" for one body
+        representation, or "full" for both.
+        """
+        if page_id is None:
+            page_id = self.page_id
+        
+        expand = FETCH_PROFILES[profile]
+        representations = [r for r in ("storage", "view") if f"body.{r}" in expand]
+        
+        data = None
+        if representations and self.cache.has_page(page_id):
+            # Cheap version-only probe; reuse the cached bodies if still current
+            probe = self.request_page(page_id, FETCH_PROFILES["metadata"])
+            if probe is None:
+                return None
+            data = self.cache.lookup(probe, representations)
+        elif representations:
+            self.cache.count_miss()
+        
+        if data is None:
+            data = self.request_page(page_id, expand)
+            if data is None:
+                return None
+            self.cache.store(data, representations)
+        
+        if self.index and 'storage' in data.get('body', {}):
+            self.index.index_body(page_id, data['version']['number'], data['body']['storage']['value'])
+        
+        if page_id == self.page_id:
+            self.current_version = data['version']['number']
+            if 'storage' in data.get('body', {}):
+                self.current_content = data['body']['storage']['value']
+        return data
+    
+    def request_page(self, page_id, expand):
+        """GET a page with the given expansions, or None on failure"""
+        url = f"{self.base_url}/rest/api/content/{page_id}"
+        params = {"expand": expand}
+        
+        # Bodies can be large; version probes should answer quickly
+        timeout = BODY_TIMEOUT if "body." in expand else METADATA_TIMEOUT
+        
+        try:
+            response = self.request("GET", url, params=params, timeout=timeout)
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"Failed to fetch page: {describe_status(response)}")
+                return None
+        except RequestCancelled:
+            return None
+        except Exception as e:
+            print(f"Error fetching page: {e}")
+            return None
+    
+    def cache_stats(self):
+        """Hit/miss counters and size of the page content cache"""
+        return self.cache.stats()
+    
+    def update_page_content(self, page_id, new_content, title, base_version=None):
+        """Update entire page content.
+        
+        base_version is the version the edit started from. The update is
+        sent straight away on top of it, so a concurrent edit comes back
+        as VERSION_CONFLICT instead of being overwritten. Without a
+        base_version the current version is looked up first.
+        """
+        url = f"{self.base_url}/rest/api/content/{page_id}"
+        
+        if base_version is None:
+            # Get current page info
+            page_data = self.fetch_page_content(page_id, "metadata")
+            if not page_data:
+                return False, "Failed to fetch page data"
+            base_version = page_data['version']['number']
         
         update_data = {
             "version": {
-                "number": page_data['version']['number'] + 1
+                "number": base_version + 1
             },
             "type": "page",
             "title": title,
@@ -167,40 +1083,61 @@ class ConfluenceClient:
         }
         
         try:
-            response = requests.put(url, json=update_data, verify=self.verify_ssl, headers=self.headers)
+            response = self.request("PUT", url, json=update_data)
             if response.status_code == 200:
+                updated = response.json()
+                if self.index:
+                    self.index.upsert_pages([updated])
+                # The new storage body is known, so the next load is a cache hit
+                self.cache.put(page_id, updated['version']['number'], "storage", new_content)
+                if self.index:
+                    self.index.index_body(page_id, updated['version']['number'], new_content)
                 return True, "Page updated successfully!"
             else:
-                error_msg = f"Failed to update: {response.status_code}"
+                error_msg = f"Failed to update: {describe_status(response)}"
                 if response.status_code == 403:
                     error_msg = "No write permission"
                 elif response.status_code == 409:
-                    error_msg = "Version conflict - please refresh"
+                    error_msg = VERSION_CONFLICT
+                elif response.status_code == 429:
+                    error_msg = THROTTLED
+                elif response.status_code in (502, 503, 504):
+                    error_msg = CONNECTION_LOST
                 return False, error_msg
+        except (requests.ConnectionError, requests.Timeout):
+            return False, CONNECTION_LOST
+        except RequestCancelled:
+            return False, CANCELLED
         except Exception as e:
             return False, f"Error updating page: {e}"
     
     def create_daily_handoff_page(self, title=None, manager_name=""):
         """Create a new daily handoff page"""
         if not title:
-            today = datetime.now().strftime("%d-%m-%Y")
-            if manager_name:
-                title = f"{today}_Handoff_{manager_name}"
-            else:
-                title = f"{today}_Handoff"
+            title = handoff_title(datetime.now(), manager_name)
         
         space_key = self.get_space_key()
         if not space_key:
+            if not self.check_health():
+                return False, CONNECTION_LOST, None
             return False, "Could not determine space key", None
         
         # Check if page already exists
-        existing_pages = self.search_pages_by_title(title)
-        if existing_pages:
-            for page in existing_pages:
-                if page['title'] == title:
-                    return True, f"Page already exists", page['id']
+        existing_page = self.get_page_by_title(title)
+        if existing_page:
+            return True, f"Page already exists", existing_page['id']
         
-        # Create new page
+        # The template's date follows the title when it is a dated handoff title
+        page_date, _ = parse_handoff_title(title)
+        page_date = datetime.strptime(page_date, "%Y-%m-%d") if page_date else datetime.now()
+        
+        result = self.post_page(title, handoff_template(page_date), space_key)
+        if result[0] and self.index:
+            self.refresh_titles()
+        return result
+    
+    def post_page(self, title, content, space_key):
+        """Create a child page of the parent page; returns (success, message, page id)"""
         create_url = f"{self.base_url}/rest/api/content"
         create_data = {
             "type": "page",
@@ -209,96 +1146,1362 @@ class ConfluenceClient:
             "ancestors": [{"id": self.parent_page_id}],
             "body": {
                 "storage": {
-                    "value": f"""<h1>GNOC Shift Handoff</h1>
+                    "value": content,
+                    "representation": "storage"
+                }
+            }
+        }
+        
+        try:
+            response = self.request("POST", create_url, json=create_data)
+            
+            if response.status_code == 200:
+                new_page = response.json()
+                page_id = new_page['id']
+                if self.index:
+                    self.index.upsert_pages([new_page])
+                return True, f"Page created successfully! (ID: {page_id})", page_id
+            else:
+                error_msg = f"Failed to create page: {describe_status(response)}"
+                if response.status_code == 403:
+                    error_msg = "No permission to create pages in this space"
+                elif response.status_code == 429:
+                    error_msg = THROTTLED
+                elif response.status_code == 400 and "already exists" in response.text:
+                    error_msg = "A page with this title already exists elsewhere in the space"
+                elif response.status_code in (502, 503, 504):
+                    error_msg = CONNECTION_LOST
+                return False, error_msg, None
+        except (requests.ConnectionError, requests.Timeout):
+            return False, CONNECTION_LOST, None
+        except RequestCancelled:
+            return False, CANCELLED, None
+        except Exception as e:
+            return False, f"Error creating page: {e}", None
+    
+    def find_existing_titles(self, titles):
+        """Which of titles already exist, checked in one pass.
+        
+        Uses the local index after an incremental sync when it is
+        populated, otherwise CQL title lookups in batches, otherwise one
+        full child listing. Returns a set of titles, or None on failure.
+        """
+        titles = list(titles)
+        if self.index and self.index.is_populated():
+            self.sync_index()
+            return self.index.existing_titles(titles)
+        
+        if self.use_cql:
+            existing = set()
+            for i in range(0, len(titles), 50):
+                quoted = ", ".join(f'"{self.escape_cql(title)}"' for title in titles[i:i + 50])
+                pages = self.run_cql(f"{self.build_cql()} AND title IN ({quoted})")
+                if pages is None:
+                    break
+                existing.update(page['title'] for page in pages)
+            else:
+                return existing
+        
+        pages = self.list_child_pages(strict=True)
+        if pages is None:
+            return None
+        if self.index:
+            self.index.replace_pages(pages)
+        wanted = set(titles)
+        return {page['title'] for page in pages if page['title'] in wanted}
+    
+    def create_pages(self, plan, results=None, cancel_event=None, max_workers=BULK_CREATE_WORKERS,
+                     rate=BULK_CREATE_RATE):
+        """Create many handoff pages: plan is a list of (title, date).
+        
+        Existing titles are found in one pass and skipped; the rest are
+        created by up to max_workers threads, starting at most rate per
+        second. Each outcome is appended to results as soon as it is
+        known, as (title, status, message, page id) with status one of
+        "created", "exists", "failed" or "cancelled". Returns results.
+        """
+        results = [] if results is None else results
+        cancel_event = cancel_event or threading.Event()
+        
+        def finish_all(status, message):
+            results.extend((title, status, message, None) for title, _ in plan)
+            return results
+        
+        space_key = self.get_space_key()
+        if not space_key:
+            return finish_all("failed", CONNECTION_LOST if not self.check_health() else "Could not determine space key")
+        existing = self.find_existing_titles(title for title, _ in plan)
+        if existing is None:
+            return finish_all("failed", "Could not list existing pages")
+        
+        limiter = RateLimiter(rate)
+        
+        def create(title, page_date):
+            if cancel_event.is_set():
+                return title, "cancelled", CANCELLED, None
+            limiter.wait()
+            success, message, page_id = self.post_page(title, handoff_template(page_date), space_key)
+            if message == CANCELLED:
+                return title, "cancelled", message, None
+            return title, "created" if success else "failed", message, page_id
+        
+        missing = []
+        for title, page_date in plan:
+            if title in existing:
+                results.append((title, "exists", "Page already exists", None))
+            else:
+                missing.append((title, page_date))
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing) or 1))) as executor:
+            create = share_cancel_event(create)
+            futures = [executor.submit(create, title, page_date) for title, page_date in missing]
+            for future in as_completed(futures):
+                results.append(future.result())
+        
+        if self.index and any(status == "created" for _, status, _, _ in results):
+            self.refresh_titles()
+        return results
+    
+    def replay_queue(self, write_queue):
+        """Send queued creates and updates in order.
+        
+        Stops at the first change that still cannot reach Confluence;
+        changes Confluence rejects (e.g. VERSION_CONFLICT) are marked failed
+        in the queue for the user to resolve. Returns the number sent.
+        """
+        sent = 0
+        for entry in write_queue.pending():
+            if entry["kind"] == "update":
+                success, message = self.update_page_content(
+                    entry["page_id"], entry["content"], entry["title"], entry["base_version"]
+                )
+            else:
+                success, message, _ = self.create_daily_handoff_page(entry["title"], entry["manager_name"])
+            
+            if message in (CONNECTION_LOST, THROTTLED, CANCELLED):
+                break
+            if success:
+                write_queue.finish(entry["id"])
+                sent += 1
+                print(f"📤 Sent queued {entry['kind']} of '{entry['title']}'")
+            else:
+                write_queue.fail(entry["id"], message)
+                print(f"⚠ Queued {entry['kind']} of '{entry['title']}' failed: {message}")
+        return sent
+    
+    def delete_page(self, page_id, refresh=True):
+        """Delete a Confluence page"""
+        url = f"{self.base_url}/rest/api/content/{page_id}"
+        
+        try:
+            response = self.request("DELETE", url)
+            
+            if response.status_code == 204:
+                if self.index:
+                    self.index.remove_page(page_id)
+                    if refresh:
+                        self.refresh_titles()
+                return True, "Page deleted successfully!"
+            elif response.status_code == 403:
+                return False, "No permission to delete this page"
+            elif response.status_code == 404:
+                return False, "Page not found"
+            elif response.status_code == 429:
+                return False, THROTTLED
+            elif response.status_code in (502, 503, 504):
+                return False, CONNECTION_LOST
+            else:
+                return False, f"Failed to delete page: {describe_status(response)}"
+        except (requests.ConnectionError, requests.Timeout):
+            return False, CONNECTION_LOST
+        except RequestCancelled:
+            return False, CANCELLED
+        except Exception as e:
+            return False, f"Error deleting page: {e}"
+    
+    def archive_page(self, page_id, archive_id=ARCHIVE_PAGE_ID, refresh=True):
+        """Move a page under the archive parent, keeping its content"""
+        if not archive_id:
+            return False, "No archive page configured (set ARCHIVE_PAGE_ID)"
+        
+        page_data = self.request_page(page_id, FETCH_PROFILES["storage"])
+        if page_data is None:
+            return False, CONNECTION_LOST if not self.check_health() else "Page not found"
+        
+        move_data = {
+            "id": page_id,
+            "type": "page",
+            "title": page_data['title'],
+            "version": {"number": page_data['version']['number'] + 1},
+            "ancestors": [{"id": archive_id}],
+            "body": {"storage": {"value": page_data['body']['storage']['value'], "representation": "storage"}}
+        }
+        
+        try:
+            response = self.request("PUT", f"{self.base_url}/rest/api/content/{page_id}", json=move_data)
+            
+            if response.status_code == 200:
+                # No longer a child of the parent page
+                if self.index:
+                    self.index.remove_page(page_id)
+                    if refresh:
+                        self.refresh_titles()
+                return True, "Page archived"
+            elif response.status_code == 403:
+                return False, "No permission to move this page"
+            elif response.status_code == 409:
+                return False, VERSION_CONFLICT
+            elif response.status_code == 429:
+                return False, THROTTLED
+            elif response.status_code in (502, 503, 504):
+                return False, CONNECTION_LOST
+            else:
+                return False, f"Failed to archive page: {describe_status(response)}"
+        except (requests.ConnectionError, requests.Timeout):
+            return False, CONNECTION_LOST
+        except RequestCancelled:
+            return False, CANCELLED
+        except Exception as e:
+            return False, f"Error archiving page: {e}"
+    
+    def remove_pages(self, pages, action="delete", results=None, cancel_event=None, dry_run=False,
+                     max_workers=BULK_REMOVE_WORKERS, retries=BULK_RETRIES):
+        """Delete or archive many pages concurrently.
+        
+        Pages whose request hits a connection problem or a version
+        conflict are retried with backoff. Each outcome is appended to
+        results as soon as it is known, as (title, status, message) with
+        status one of "deleted", "archived", "would delete", "would
+        archive", "failed" or "cancelled". A dry run only reports what
+        would happen. Returns results.
+        """
+        results = [] if results is None else results
+        cancel_event = cancel_event or threading.Event()
+        done_status = "deleted" if action == "delete" else "archived"
+        
+        if dry_run:
+            results.extend((page['title'], f"would {action}", "Dry run - nothing changed") for page in pages)
+            return results
+        
+        def remove(page):
+            for attempt in range(retries + 1):
+                if cancel_event.is_set():
+                    return page['title'], "cancelled", CANCELLED
+                if action == "delete":
+                    success, message = self.delete_page(page['id'], refresh=False)
+                else:
+                    success, message = self.archive_page(page['id'], refresh=False)
+                if success:
+                    return page['title'], done_status, message
+                if message == CANCELLED:
+                    return page['title'], "cancelled", message
+                if message not in (CONNECTION_LOST, THROTTLED, VERSION_CONFLICT) or attempt == retries:
+                    return page['title'], "failed", message
+                # Wait before retrying, unless cancelled meanwhile
+                cancel_event.wait(2 ** attempt + random.random())
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pages) or 1))) as executor:
+            remove = share_cancel_event(remove)
+            futures = [executor.submit(remove, page) for page in pages]
+            for future in as_completed(futures):
+                results.append(future.result())
+        
+        if self.index and any(status == done_status for _, status, _ in results):
+            self.refresh_titles()
+        return results
+    
+    def get_space_key(self):
+        """Get space key"""
+        if self.space_key:
+            return self.space_key
+            
+        page_data = self.fetch_page_content(profile="metadata")
+        if page_data and 'space' in page_data:
+            self.space_key = page_data['space']['key']
+            return self.space_key
+        return None
+    
+    def check_write_permission(self):
+        """Check if user has write permission"""
+        page_data = self.fetch_page_content(profile="metadata")
+        if not page_data:
+            return False
+        
+        url = f"{self.base_url}/rest/api/content/{self.page_id}/restriction"
+        try:
+            response = self.request("GET", url)
+            return response.status_code != 403
+        except:
+            return False
 
-<h2>Shift Details:</h2>
-<p><strong>Outgoing Manager:</strong> </p>
-<p><strong>Incoming Manager:</strong> </p>
-<p><strong>Date:</strong> {datetime.now().strftime("%d %B %Y")}</p>
-<p><strong>Shift Time:</strong> </p>
 
-<h2>1. Active Incidents / Ongoing Issues:</h2>
-<p>&nbsp;</p>
+class PageContentCache:
+    """In-memory LRU cache of page bodies.
+    
+    Entries are keyed by (page id, version, representation), so a version
+    probe is enough to tell whether a cached body is still current. The
+    least recently used bodies are evicted once max_bytes is exceeded.
+    """
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.page_ids = {}  # page id -> number of cached entries
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def has_page(self, page_id):
+        """True if any body of this page is cached"""
+        with self.lock:
+            return page_id in self.page_ids
+    
+    def put(self, page_id, version, representation, value):
+        """Store one body, evicting old entries to stay under max_bytes"""
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        
+        key = (page_id, version, representation)
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+            self.entries[key] = (value, size)
+            self.page_ids[page_id] = self.page_ids.get(page_id, 0) + 1
+            self.total_bytes += size
+            
+            while self.total_bytes > self.max_bytes:
+                self.remove(next(iter(self.entries)))
+    
+    def remove(self, key):
+        """Drop one entry (caller holds the lock)"""
+        _, size = self.entries.pop(key)
+        self.total_bytes -= size
+        page_id = key[0]
+        self.page_ids[page_id] -= 1
+        if not self.page_ids[page_id]:
+            del self.page_ids[page_id]
+    
+    def store(self, data, representations):
+        """Cache the requested bodies of a fetched page"""
+        for representation in representations:
+            self.put(data['id'], data['version']['number'], representation,
+                     data['body'][representation]['value'])
+    
+    def lookup(self, probe, representations):
+        """Rebuild a fetched page from the cache for the probed version.
+        
+        Returns None (a miss) unless every requested body is cached.
+        """
+        version = probe['version']['number']
+        with self.lock:
+            keys = [(probe['id'], version, r) for r in representations]
+            if not all(key in self.entries for key in keys):
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            body = {}
+            for key in keys:
+                self.entries.move_to_end(key)
+                body[key[2]] = {"value": self.entries[key][0], "representation": key[2]}
+        
+        return dict(probe, body=body)
+    
+    def count_miss(self):
+        """Record a fetch for a page that has nothing cached"""
+        with self.lock:
+            self.misses += 1
+    
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes
+            }
 
-<h2>2. Scheduled Maintenance:</h2>
-<p>&nbsp;</p>
 
-<h2>3. Alerts &amp; Monitoring Anomalies:</h2>
-<p>&nbsp;</p>
+class SnapshotStore:
+    """Rendered copies of recent handoff pages, kept on disk for instant start-up"""
+    
+    def __init__(self, path, max_entries=4):
+        self.path = path
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+    
+    def load(self):
+        """Read all snapshots (caller holds the lock)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def get(self, title):
+        """Saved snapshot for a page title, or None"""
+        with self.lock:
+            return self.load().get(title)
+    
+    def put(self, page, page_data):
+        """Save the rendered view of a fetched page"""
+        snapshot = {
+            "page": {"id": page['id'], "title": page['title']},
+            "version": page_data['version']['number'],
+            "html": page_data['body']['view']['value'],
+            "saved_at": datetime.now().strftime("%d-%m-%Y %H:%M")
+        }
+        
+        with self.lock:
+            snapshots = self.load()
+            snapshots.pop(page['title'], None)
+            snapshots[page['title']] = snapshot
+            
+            # Keep only the most recently saved pages
+            for title in list(snapshots)[:-self.max_entries]:
+                del snapshots[title]
+            
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshots, f)
+            os.replace(tmp_path, self.path)
 
-<h2>4. Team Resource Status:</h2>
-<p>&nbsp;</p>
 
-<h2>5. Pending Actions / Follow-Ups:</h2>
-<p>&nbsp;</p>
+class WriteQueue:
+    """Durable write-ahead log of page creates and updates waiting for Confluence.
+    
+    Every queued change is appended to a JSON-lines file and fsynced before
+    the caller reports it saved; later lines mark entries done or failed.
+    Pending changes are rebuilt by replaying the log at start-up, and the
+    file is compacted once nothing is left in it.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # entry id -> entry, in queue order
+        self.next_id = 1
+        self.load()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def load(self):
+        """Rebuild the queue from the log"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return
+        
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # a write cut short by a crash
+            entry_id = record.get("id")
+            if record.get("op") == "add":
+                # An update that superseded older ones replaces them even if
+                # a crash came before they were marked done
+                for replaced_id in record.get("replaces", []):
+                    self.entries.pop(replaced_id, None)
+                self.entries[entry_id] = record
+                self.next_id = max(self.next_id, entry_id + 1)
+            elif record.get("op") == "done":
+                self.entries.pop(entry_id, None)
+            elif record.get("op") == "failed" and entry_id in self.entries:
+                self.entries[entry_id]["error"] = record.get("error")
+        
+        # Drop a torn last line so new records start on a line of their own
+        if lines and not lines[-1].endswith("\n"):
+            with self.lock:
+                self.compact()
+    
+    def append(self, record):
+        """Write one record to disk (caller holds the lock)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def add(self, kind, title, content=None, page_id=None, base_version=None,
+            base_content=None, manager_name=""):
+        """Queue a "create" or "update"; returns the entry.
+        
+        A newer update to a page that already has one pending replaces it,
+        keeping the original base version so conflicts are still detected.
+        The new entry is written before the old one is marked done, so a
+        crash in between never loses both.
+        """
+        with self.lock:
+            replaced = []
+            if kind == "update":
+                for entry in self.entries.values():
+                    if entry["kind"] == "update" and entry["page_id"] == page_id and "error" not in entry:
+                        base_version = entry["base_version"]
+                        base_content = entry["base_content"]
+                        replaced.append(entry["id"])
+            
+            entry = {
+                "op": "add",
+                "id": self.next_id,
+                "kind": kind,
+                "title": title,
+                "page_id": page_id,
+                "content": content,
+                "base_version": base_version,
+                "base_content": base_content,
+                "manager_name": manager_name,
+                "queued_at": datetime.now().strftime("%d-%m-%Y %H:%M"),
+            }
+            if replaced:
+                entry["replaces"] = replaced
+            self.append(entry)
+            self.entries[entry["id"]] = entry
+            self.next_id += 1
+            
+            for replaced_id in replaced:
+                self.append({"op": "done", "id": replaced_id})
+                del self.entries[replaced_id]
+            return entry
+    
+    def pending(self):
+        """Entries still to be sent, oldest first"""
+        with self.lock:
+            return [entry for entry in self.entries.values() if "error" not in entry]
+    
+    def failed(self):
+        """Entries Confluence rejected, such as version conflicts"""
+        with self.lock:
+            return [entry for entry in self.entries.values() if "error" in entry]
+    
+    def finish(self, entry_id):
+        """Drop an entry that was sent or discarded"""
+        with self.lock:
+            if self.entries.pop(entry_id, None) is None:
+                return
+            if self.entries:
+                self.append({"op": "done", "id": entry_id})
+            else:
+                self.compact()
+    
+    def fail(self, entry_id, error):
+        """Keep an entry Confluence rejected, with the reason, for the user to resolve"""
+        with self.lock:
+            if entry_id in self.entries:
+                self.entries[entry_id]["error"] = error
+                self.append({"op": "failed", "id": entry_id, "error": error})
+    
+    def compact(self):
+        """Rewrite the log with only the remaining entries (caller holds the lock)"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self.entries.values():
+                f.write(json.dumps({k: v for k, v in entry.items() if k != "error"}) + "\n")
+                if "error" in entry:
+                    f.write(json.dumps({"op": "failed", "id": entry["id"], "error": entry["error"]}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class DraftStore:
+    """Crash-safe autosaved drafts of pages being edited, one file per page id.
+    
+    A draft file starts with the full content and the version the edit is
+    based on, followed by one line-level delta per autosave; it is
+    rewritten from scratch every DRAFT_MAX_DELTAS saves. Saves run in
+    order on a single background thread so typing never waits on disk.
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.contents = {}  # page id -> last saved content
+        self.deltas = {}  # page id -> deltas written since the last full copy
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+    
+    def path(self, page_id):
+        return os.path.join(self.directory, f"{page_id}.jsonl")
+    
+    def save(self, page_id, title, base_version, base_content, render):
+        """Queue an autosave; render() is called on the autosave thread to produce the content"""
+        return self.executor.submit(self.write, page_id, title, base_version, base_content, render)
+    
+    def write(self, page_id, title, base_version, base_content, render):
+        """Append the change since the last save, if there is one"""
+        content = render()
+        with self.lock:
+            previous = self.contents.get(page_id)
+            if content == previous:
+                return False
+            if content == base_content:
+                # Back to the page as loaded: nothing left to recover
+                self.remove(page_id)
+                return False
+            
+            saved_at = datetime.now().strftime("%d-%m-%Y %H:%M")
+            if previous is None or self.deltas.get(page_id, 0) >= DRAFT_MAX_DELTAS:
+                record = {"op": "base", "title": title, "base_version": base_version,
+                          "base_content": base_content, "content": content, "saved_at": saved_at}
+                os.makedirs(self.directory, exist_ok=True)
+                tmp_path = f"{self.path(page_id)}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path(page_id))
+                self.deltas[page_id] = 0
+            else:
+                old_lines = previous.splitlines(keepends=True)
+                new_lines = content.splitlines(keepends=True)
+                matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+                ops = [[i1, i2, new_lines[j1:j2]]
+                       for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+                with open(self.path(page_id), "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"op": "delta", "ops": ops, "saved_at": saved_at}) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.deltas[page_id] += 1
+            
+            self.contents[page_id] = content
+            return True
+    
+    def load(self, page_id):
+        """Rebuild a draft from its file, or None"""
+        try:
+            with open(self.path(page_id), "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return None
+        
+        draft = None
+        content_lines = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # a save cut short by a crash; earlier ones are intact
+            if record["op"] == "base":
+                draft = dict(record, page_id=page_id)
+                content_lines = record["content"].splitlines(keepends=True)
+            elif draft is not None:
+                # Apply back to front so earlier line numbers stay valid
+                for i1, i2, new_lines in reversed(record["ops"]):
+                    content_lines[i1:i2] = new_lines
+                draft["saved_at"] = record["saved_at"]
+        
+        if draft is not None:
+            draft["content"] = "".join(content_lines)
+            del draft["op"]
+        return draft
+    
+    def load_all(self):
+        """Every draft left on disk, e.g. after a crash"""
+        try:
+            names = sorted(os.listdir(self.directory))
+        except OSError:
+            return []
+        drafts = [self.load(name[:-len(".jsonl")]) for name in names if name.endswith(".jsonl")]
+        return [draft for draft in drafts if draft]
+    
+    def discard(self, page_id):
+        """Remove a page's draft once it is saved to Confluence (after pending autosaves)"""
+        def remove():
+            with self.lock:
+                self.remove(page_id)
+        return self.executor.submit(remove)
+    
+    def remove(self, page_id):
+        """Delete a page's draft file and state (caller holds the lock)"""
+        self.contents.pop(page_id, None)
+        self.deltas.pop(page_id, None)
+        try:
+            os.remove(self.path(page_id))
+        except OSError:
+            pass
+    
+    def close(self):
+        """Finish pending autosaves"""
+        self.executor.shutdown(wait=True)
+
+
+class PageIndex:
+    """Local SQLite index of the child pages of the parent page"""
+    
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Shared between the UI thread and background syncs
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    page_date TEXT,
+                    manager TEXT,
+                    version INTEGER,
+                    last_modified TEXT
+                );
+                CREATE INDEX IF NOT EXISTS pages_by_date ON pages (page_date);
+                CREATE INDEX IF NOT EXISTS pages_by_title ON pages (title);
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS bodies (
+                    id TEXT PRIMARY KEY,
+                    version INTEGER,
+                    body TEXT NOT NULL
+                );
+            """)
+            self.fts = self.create_fts()
+    
+    def create_fts(self):
+        """Set up the FTS5 index over bodies; False if SQLite lacks FTS5 (caller holds the lock)"""
+        try:
+            self.conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS body_fts USING fts5(
+                    body, content='bodies', content_rowid='rowid'
+                );
+                CREATE TRIGGER IF NOT EXISTS bodies_ai AFTER INSERT ON bodies BEGIN
+                    INSERT INTO body_fts (rowid, body) VALUES (new.rowid, new.body);
+                END;
+                CREATE TRIGGER IF NOT EXISTS bodies_ad AFTER DELETE ON bodies BEGIN
+                    INSERT INTO body_fts (body_fts, rowid, body) VALUES ('delete', old.rowid, old.body);
+                END;
+                CREATE TRIGGER IF NOT EXISTS bodies_au AFTER UPDATE ON bodies BEGIN
+                    INSERT INTO body_fts (body_fts, rowid, body) VALUES ('delete', old.rowid, old.body);
+                    INSERT INTO body_fts (rowid, body) VALUES (new.rowid, new.body);
+                END;
+            """)
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"⚠ SQLite FTS5 unavailable, body search will be slower: {e}")
+            return False
+    
+    def close(self):
+        """Close the database"""
+        with self.lock:
+            self.conn.close()
+    
+    def _upsert(self, pages):
+        """Insert or update pages (caller holds the lock)"""
+        rows = []
+        for page in pages:
+            page_date, manager = parse_handoff_title(page['title'])
+            version = page.get('version') or {}
+            rows.append((page['id'], page['title'], page_date, manager,
+                         version.get('number'), version.get('when')))
+        
+        before = self.conn.total_changes
+        self.conn.executemany("""
+            INSERT INTO pages (id, title, page_date, manager, version, last_modified)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                title = excluded.title,
+                page_date = excluded.page_date,
+                manager = excluded.manager,
+                version = excluded.version,
+                last_modified = excluded.last_modified
+            WHERE pages.version IS NOT excluded.version OR pages.title IS NOT excluded.title
+        """, rows)
+        return self.conn.total_changes - before
+    
+    def upsert_pages(self, pages):
+        """Add or refresh pages from API results, returning the number changed"""
+        with self.lock, self.conn:
+            return self._upsert(pages)
+    
+    def replace_pages(self, pages):
+        """Make the index match a full child listing, returning the number changed"""
+        with self.lock, self.conn:
+            changed = self._upsert(pages)
+            
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS live_ids (id TEXT PRIMARY KEY)")
+            self.conn.execute("DELETE FROM live_ids")
+            self.conn.executemany("INSERT OR IGNORE INTO live_ids (id) VALUES (?)",
+                                  [(page['id'],) for page in pages])
+            before = self.conn.total_changes
+            self.conn.execute("DELETE FROM pages WHERE id NOT IN (SELECT id FROM live_ids)")
+            changed += self.conn.total_changes - before
+            self.conn.execute("DELETE FROM bodies WHERE id NOT IN (SELECT id FROM pages)")
+            return changed
+    
+    def existing_titles(self, titles):
+        """The subset of titles that are in the index"""
+        titles = list(titles)
+        found = set()
+        with self.lock:
+            for i in range(0, len(titles), 500):
+                batch = titles[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT title FROM pages WHERE title IN ({', '.join('?' * len(batch))})", batch
+                )
+                found.update(row[0] for row in rows)
+        return found
+    
+    def remove_page(self, page_id):
+        """Drop a deleted page"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM pages WHERE id = ?", (page_id,))
+            self.conn.execute("DELETE FROM bodies WHERE id = ?", (page_id,))
+    
+    def index_body(self, page_id, version, content):
+        """Make a page's storage body searchable, unless this version already is"""
+        with self.lock:
+            row = self.conn.execute("SELECT version FROM bodies WHERE id = ?", (page_id,)).fetchone()
+        if row and row[0] == version:
+            return False
+        
+        text = storage_to_text(content)
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO bodies (id, version, body) VALUES (?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET version = excluded.version, body = excluded.body
+            """, (page_id, version, text))
+        return True
+    
+    def stale_bodies(self, days=None):
+        """IDs of pages whose indexed body is missing or older than the page, newest first"""
+        sql = """
+            SELECT p.id FROM pages p LEFT JOIN bodies b ON b.id = p.id
+            WHERE b.version IS NOT p.version
+        """
+        params = ()
+        if days:
+            sql += " AND COALESCE(p.page_date, substr(p.last_modified, 1, 10)) >= ?"
+            params = ((datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d"),)
+        sql += " ORDER BY p.page_date IS NULL, p.page_date DESC"
+        
+        with self.lock:
+            return [row[0] for row in self.conn.execute(sql, params)]
+    
+    def search_bodies(self, search_term, days=None):
+        """Find pages whose body contains every word of search_term, newest first.
+        
+        Each page carries an "excerpt" of the text around the match.
+        """
+        words = search_term.split()
+        if not words:
+            return []
+        
+        params = []
+        if self.fts:
+            # Quote each word so IDs like INC-12345 are matched as phrases, not query syntax
+            sql = """
+                SELECT p.id, p.title, p.version, p.last_modified,
+                       snippet(body_fts, 0, '', '', '…', 12)
+                FROM body_fts JOIN bodies b ON b.rowid = body_fts.rowid JOIN pages p ON p.id = b.id
+                WHERE body_fts MATCH ?
+            """
+            params.append(" ".join('"' + word.replace('"', '""') + '"' for word in words))
+        else:
+            sql = """
+                SELECT p.id, p.title, p.version, p.last_modified, b.body
+                FROM bodies b JOIN pages p ON p.id = b.id WHERE 1
+            """
+            for word in words:
+                escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                sql += " AND b.body LIKE ? ESCAPE '\\'"
+                params.append(f"%{escaped}%")
+        if days:
+            sql += " AND COALESCE(p.page_date, substr(p.last_modified, 1, 10)) >= ?"
+            params.append((datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d"))
+        sql += " ORDER BY p.page_date IS NULL, p.page_date DESC, p.title"
+        
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        
+        pages = []
+        for row in rows:
+            page = self.row_to_page(row[:4])
+            page["excerpt"] = row[4] if self.fts else self.excerpt(row[4], words[0])
+            pages.append(page)
+        return pages
+    
+    def excerpt(self, text, word, width=60):
+        """Text around the first occurrence of word"""
+        at = max(0, text.lower().find(word.lower()))
+        start = max(0, at - width)
+        end = at + len(word) + width
+        return ("…" if start else "") + text[start:end] + ("…" if end < len(text) else "")
+    
+    def search(self, search_term):
+        """Find pages whose title contains search_term, newest first"""
+        sql = "SELECT id, title, version, last_modified FROM pages"
+        params = ()
+        if search_term:
+            escaped = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql += " WHERE title LIKE ? ESCAPE '\\'"
+            params = (f"%{escaped}%",)
+        sql += " ORDER BY page_date IS NULL, page_date DESC, title"
+        
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [self.row_to_page(row) for row in rows]
+    
+    def row_to_page(self, row):
+        """Shape an index row like a Confluence content result"""
+        page_id, title, version, last_modified = row
+        return {
+            "id": page_id,
+            "title": title,
+            "version": {"number": version, "when": last_modified}
+        }
+    
+    def is_populated(self):
+        """True once a full listing has been stored"""
+        return self.get_sync_time("last_full_sync") is not None
+    
+    def get_sync_time(self, key):
+        """Read a sync timestamp from the meta table"""
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+    
+    def set_sync_time(self, key, value):
+        """Store a sync timestamp in the meta table"""
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                              (key, value.isoformat()))
+
+
+class TitleIndex:
+    """In-memory trigram index over page titles for search-as-you-type.
+    
+    Each title is indexed together with its ISO date, so "15-03", "2024-03"
+    and "handoff bob" all match DD-MM-YYYY_Handoff_Manager titles. Every
+    whitespace or underscore separated word of a query must appear in the
+    title; answers keep the newest-first order the pages were built in.
+    """
+    
+    def __init__(self):
+        self.data = ([], [], {})  # (search keys, pages, trigram -> positions)
+        self.loaded = False
+    
+    def __len__(self):
+        return len(self.data[1])
+    
+    def build(self, pages, complete=True):
+        """Index pages (newest first), replacing the previous contents.
+        
+        complete says whether pages are all the child pages; until they
+        are, searches are left to the network (see loaded).
+        """
+        keys = []
+        grams = {}
+        for page in pages:
+            key = self.search_key(page['title'])
+            for gram in {key[i:i + 3] for i in range(len(key) - 2)}:
+                grams.setdefault(gram, []).append(len(keys))
+            keys.append(key)
+        
+        # One assignment, so searches on the Tk thread never see a half-built index
+        self.data = (keys, list(pages), grams)
+        self.loaded = complete
+    
+    def search_key(self, title):
+        """Lower-cased title plus its ISO date when it follows the handoff convention"""
+        page_date, _ = parse_handoff_title(title)
+        key = title.lower()
+        return f"{key}\n{page_date}" if page_date else key
+    
+    def search(self, search_term):
+        """Pages whose title contains every word of search_term"""
+        keys, pages, grams = self.data
+        words = [word for word in re.split(r"[\s_]+", search_term.lower()) if word]
+        if not words:
+            return list(pages)
+        
+        # Start from the rarest trigram of the query and check the few
+        # titles it points at; short queries scan the titles directly
+        candidates = None
+        for word in words:
+            for i in range(len(word) - 2):
+                positions = grams.get(word[i:i + 3])
+                if positions is None:
+                    return []
+                if candidates is None or len(positions) < len(candidates):
+                    candidates = positions
+        if candidates is None:
+            candidates = range(len(keys))
+        
+        for word in words:
+            candidates = [i for i in candidates if word in keys[i]]
+        return [pages[i] for i in candidates]
+
+
+def escape_html(text):
+    """Escape HTML special characters"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+class Span:
+    """A run of text sharing the same inline marks (bold, italic, underline)"""
+    
+    __slots__ = ("text", "marks")
+    
+    def __init__(self, text, marks=frozenset()):
+        self.text = text
+        self.marks = marks
+    
+    def __repr__(self):
+        return f"Span({self.text!r}, {sorted(self.marks)})"
+
+
+class Block:
+    """One line of a handoff: a paragraph, heading or list item made of spans"""
+    
+    __slots__ = ("kind", "spans")
+    
+    def __init__(self, kind="paragraph", spans=None):
+        self.kind = kind
+        self.spans = spans if spans is not None else []
+    
+    def __repr__(self):
+        return f"Block({self.kind!r}, {self.spans!r})"
+    
+    @property
+    def text(self):
+        return "".join(span.text for span in self.spans)
+    
+    def append(self, text, marks=frozenset()):
+        """Add text, merging it into the last span when the marks match"""
+        if not text:
+            return
+        if self.spans and self.spans[-1].marks == marks:
+            self.spans[-1].text += text
+        else:
+            self.spans.append(Span(text, marks))
+    
+    def to_storage(self):
+        """Render the spans as storage-format HTML"""
+        parts = []
+        for span in self.spans:
+            start = [INLINE_TAGS[tag][0] for tag in INLINE_TAGS if tag in span.marks]
+            end = [INLINE_TAGS[tag][1] for tag in INLINE_TAGS if tag in span.marks]
+            parts.append("".join(start) + escape_html(span.text) + "".join(reversed(end)))
+        return "".join(parts)
 
-<h2>6. Escalations (If Any):</h2>
-<p>&nbsp;</p>
 
-<h2>7. Other Notes / Announcements:</h2>
-<p>&nbsp;</p>""",
-                    "representation": "storage"
-                }
-            }
-        }
+class Document:
+    """Editor-independent handoff content: a list of blocks.
+    
+    Converts to and from Confluence storage format and the text plus tag
+    ranges the editor displays, without touching Tk, so conversions can
+    run in worker threads and be benchmarked headless. simplified names
+    the kinds of storage content that could not be kept (tables, macros...).
+    """
+    
+    def __init__(self, blocks=None, simplified=None):
+        self.blocks = blocks if blocks is not None else []
+        self.simplified = simplified if simplified is not None else set()
+    
+    @classmethod
+    def from_storage(cls, html_content):
+        """Parse storage-format HTML"""
+        parser = StorageHTMLParser()
+        parser.feed(html_content)
+        return parser.result()
+    
+    @classmethod
+    def from_editor_dump(cls, dump):
+        """Build a document from Text.dump(text=True, tag=True) output.
         
-        try:
-            response = requests.post(create_url, json=create_data, 
-                                   verify=self.verify_ssl, headers=self.headers)
+        The block kind comes from the tags at the start of each line and
+        list markers typed into the text ("• ", "1. ") are dropped.
+        """
+        blocks = []
+        active = set()
+        line_tags = None
+        runs = []
+        
+        def end_line():
+            text = "".join(part for part, _ in runs)
+            kind = next((tag for tag in BLOCK_TAGS if tag in line_tags), "paragraph") if text.strip() else "paragraph"
+            skip = 0
+            if kind in LIST_TAGS:
+                marker = LIST_MARKER_RE.match(text)
+                skip = marker.end() if marker else 0
             
-            if response.status_code == 200:
-                new_page = response.json()
-                page_id = new_page['id']
-                return True, f"Page created successfully! (ID: {page_id})", page_id
-            else:
-                error_msg = f"Failed to create page: {response.status_code}"
-                if response.status_code == 403:
-                    error_msg = "No permission to create pages in this space"
-                return False, error_msg, None
-        except Exception as e:
-            return False, f"Error creating page: {e}", None
+            block = Block(kind)
+            for part, marks in runs:
+                if skip:
+                    part, skip = part[skip:], max(0, skip - len(part))
+                block.append(part, marks)
+            blocks.append(block)
+        
+        for key, value, _ in dump:
+            if key == "tagon":
+                active.add(value)
+            elif key == "tagoff":
+                active.discard(value)
+            elif key == "text":
+                for i, part in enumerate(value.split("\n")):
+                    if i:
+                        end_line()
+                        line_tags = None
+                        runs = []
+                    if part:
+                        if line_tags is None:
+                            line_tags = frozenset(active)
+                        runs.append((part, frozenset(active.intersection(INLINE_TAGS))))
+        
+        line_tags = line_tags or frozenset()
+        end_line()
+        return cls(blocks)
     
-    def delete_page(self, page_id):
-        """Delete a Confluence page"""
-        url = f"{self.base_url}/rest/api/content/{page_id}"
+    def to_storage(self):
+        """Serialize to storage-format HTML"""
+        html_parts = []
+        open_list = None
         
-        try:
-            response = requests.delete(url, verify=self.verify_ssl, headers=self.headers)
+        for block in self.blocks:
+            list_tag = LIST_TAGS.get(block.kind)
+            blank = not list_tag and not block.text.strip()
             
-            if response.status_code == 204:
-                return True, "Page deleted successfully!"
-            elif response.status_code == 403:
-                return False, "No permission to delete this page"
-            elif response.status_code == 404:
-                return False, "Page not found"
+            # Close a list once its items end
+            if open_list and open_list != list_tag:
+                html_parts.append(f"</{open_list}>")
+                open_list = None
+            
+            if blank:
+                html_parts.append("<p>&nbsp;</p>")
+            elif list_tag:
+                if not open_list:
+                    html_parts.append(f"<{list_tag}>")
+                    open_list = list_tag
+                html_parts.append(f"<li>{block.to_storage()}</li>")
+            elif block.kind in ("h1", "h2", "h3"):
+                html_parts.append(f"<{block.kind}>{block.to_storage()}</{block.kind}>")
             else:
-                return False, f"Failed to delete page: {response.status_code}"
-        except Exception as e:
-            return False, f"Error deleting page: {e}"
+                html_parts.append(f"<p>{block.to_storage()}</p>")
+        
+        if open_list:
+            html_parts.append(f"</{open_list}>")
+        
+        return '\n'.join(html_parts)
     
-    def get_space_key(self):
-        """Get space key"""
-        if self.space_key:
-            return self.space_key
+    def to_editor(self):
+        """Render as (text, {tag: ["line.col" start, end, ...]}) for the editor.
+        
+        List items get their "• " or "N. " marker back; each tag's ranges
+        are flat so the editor can apply them in a few tag_add calls.
+        """
+        lines = []
+        ranges = {}
+        number = 0
+        
+        def add_range(tag, start, end):
+            if start != end:
+                ranges.setdefault(tag, []).extend((start, end))
+        
+        for line_no, block in enumerate(self.blocks, 1):
+            number = number + 1 if block.kind == "number" else 0
+            marker = "• " if block.kind == "bullet" else f"{number}. " if number else ""
+            col = len(marker)
+            open_marks = {}  # mark -> start column
             
-        page_data = self.fetch_page_content()
-        if page_data and 'space' in page_data:
-            self.space_key = page_data['space']['key']
-            return self.space_key
-        return None
+            for span in block.spans:
+                for mark in [mark for mark in open_marks if mark not in span.marks]:
+                    add_range(mark, f"{line_no}.{open_marks.pop(mark)}", f"{line_no}.{col}")
+                for mark in span.marks:
+                    open_marks.setdefault(mark, col)
+                col += len(span.text)
+            for mark, start in open_marks.items():
+                add_range(mark, f"{line_no}.{start}", f"{line_no}.{col}")
+            
+            if block.kind != "paragraph":
+                add_range(block.kind, f"{line_no}.0", f"{line_no}.{col}")
+            lines.append(marker + block.text)
+        
+        return "\n".join(lines), ranges
+
+
+class StorageHTMLParser(HTMLParser):
+    """Stream Confluence storage format into a Document.
     
-    def check_write_permission(self):
-        """Check if user has write permission"""
-        page_data = self.fetch_page_content()
-        if not page_data:
-            return False
+    Tables are flattened to one " | " separated line per row and macro
+    parameters are dropped, so large or unusual pages still load; the
+    kinds of content simplified this way are collected in simplified.
+    """
+    
+    HEADINGS = {"h1": "h1", "h2": "h2", "h3": "h3", "h4": "h3", "h5": "h3", "h6": "h3"}
+    INLINE = {"strong": "bold", "b": "bold", "em": "italic", "i": "italic", "u": "underline"}
+    BLOCKS = {"p", "div", "blockquote", "pre", "table", "tbody", "thead", "ul", "ol"}
+    SKIPPED = {"ac:parameter", "ac:placeholder", "script", "style"}
+    SIMPLIFIED = {"table": "tables", "ac:structured-macro": "macros", "ac:image": "images",
+                  "img": "images", "a": "links", "ac:link": "links"}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self.line = Block()
+        self.col = 0
+        self.marks = {}  # inline mark -> nesting depth
+        self.heading = None  # heading kind for the current block
+        self.lists = []  # stack of list kinds
+        self.item_open = False  # a list item has started, even if still empty
+        self.skip_depth = 0
+        self.cell_depth = 0
+        self.cell_index = 0
+        self.content_start = 0  # column after a cell separator
+        self.pending_space = False
+        self.simplified = set()
+    
+    def handle_starttag(self, tag, attrs):
+        if self.skip_depth or tag in self.SKIPPED:
+            self.skip_depth += tag in self.SKIPPED
+            return
         
-        url = f"{self.base_url}/rest/api/content/{self.page_id}/restriction"
-        try:
-            response = requests.get(url, verify=self.verify_ssl, headers=self.headers)
-            return response.status_code != 403
-        except:
-            return False
+        if tag in self.SIMPLIFIED:
+            self.simplified.add(self.SIMPLIFIED[tag])
+        
+        if tag in self.INLINE:
+            self.open_inline(self.INLINE[tag])
+        elif self.cell_depth and (tag in ("p", "div", "br", "li") or tag in self.HEADINGS):
+            # Keep table rows on one line
+            self.pending_space = self.col > self.content_start
+        elif tag in self.HEADINGS:
+            self.soft_newline()
+            self.heading = self.HEADINGS[tag]
+        elif tag in ("ul", "ol"):
+            self.newline()
+            self.lists.append("bullet" if tag == "ul" else "number")
+        elif tag == "li":
+            self.newline()
+            if self.lists:
+                self.line.kind = self.lists[-1]
+                self.item_open = True
+        elif tag == "tr":
+            self.newline()
+            self.cell_index = 0
+        elif tag in ("td", "th"):
+            if self.cell_index:
+                self.pending_space = False
+                self.write(" | ")
+            self.cell_index += 1
+            self.cell_depth += 1
+            self.content_start = self.col
+        elif tag == "br":
+            self.newline()
+        elif tag in self.BLOCKS:
+            self.soft_newline()
+    
+    def handle_endtag(self, tag):
+        if self.skip_depth:
+            self.skip_depth -= tag in self.SKIPPED
+            return
+        
+        if tag in self.INLINE:
+            self.close_inline(self.INLINE[tag])
+        elif tag in ("td", "th"):
+            self.cell_depth = max(0, self.cell_depth - 1)
+        elif self.cell_depth:
+            return
+        elif tag in self.HEADINGS:
+            self.newline()
+            self.heading = None
+        elif tag in ("ul", "ol"):
+            self.newline()
+            if self.lists:
+                self.lists.pop()
+        elif tag in ("li", "tr") or tag in self.BLOCKS:
+            self.newline()
+    
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        
+        # Collapse source whitespace but keep non-breaking spaces as spaces.
+        # Leading/trailing whitespace is held back so that whitespace
+        # between block tags never ends up in the text
+        text = re.sub(r"[ \t\r\n]+", " ", data)
+        if not text.strip(" "):
+            self.pending_space = self.pending_space or (bool(text) and self.col > self.content_start)
+            return
+        
+        if text.startswith(" ") and self.col > self.content_start:
+            self.pending_space = True
+        if text.endswith(" "):
+            self.write(text.strip(" ").replace("\xa0", " "))
+            self.pending_space = True
+        else:
+            self.write(text.lstrip(" ").replace("\xa0", " "))
+    
+    def unknown_decl(self, data):
+        # Code macro bodies arrive as CDATA sections
+        if data.startswith("CDATA[") and not self.skip_depth:
+            for i, code_line in enumerate(data[6:].split("\n")):
+                if i:
+                    self.newline()
+                self.write(code_line)
+    
+    def write(self, text):
+        """Append text to the current block"""
+        if not text:
+            return
+        if self.pending_space:
+            self.pending_space = False
+            text = " " + text
+        if not self.col and self.heading and self.line.kind == "paragraph":
+            self.line.kind = self.heading
+        self.line.append(text, frozenset(self.marks))
+        self.col += len(text)
+    
+    def soft_newline(self):
+        """End the current block if it has content"""
+        if self.col > self.content_start:
+            self.newline()
+        self.pending_space = False
+    
+    def newline(self):
+        """End the current block unless it is still empty"""
+        self.pending_space = False
+        if not self.col and not self.item_open:
+            return
+        self.blocks.append(self.line)
+        self.line = Block()
+        self.col = 0
+        self.content_start = 0
+        self.item_open = False
+    
+    def open_inline(self, mark):
+        """Start an inline mark"""
+        # A space before the tag belongs outside it
+        if self.pending_space:
+            self.pending_space = False
+            self.write(" ")
+        self.marks[mark] = self.marks.get(mark, 0) + 1
+    
+    def close_inline(self, mark):
+        """End an inline mark"""
+        if mark in self.marks:
+            self.marks[mark] -= 1
+            if not self.marks[mark]:
+                del self.marks[mark]
+    
+    def result(self):
+        """Finish parsing and return the Document"""
+        self.close()
+        self.marks.clear()
+        self.newline()
+        return Document(self.blocks, self.simplified)
 
 
 class RichTextEditor(tk.Frame):
@@ -444,111 +2647,33 @@ class RichTextEditor(tk.Frame):
         except tk.TclError:
             pass
     
+    def get_document(self):
+        """Read the editor content into a Document"""
+        # One Tcl round trip for the whole document, walked in linear time
+        return Document.from_editor_dump(self.text.dump("1.0", "end-1c", text=True, tag=True))
+    
     def get_html_content(self):
         """Convert formatted text to HTML"""
-        html_parts = []
-        
-        # Get all text
-        content = self.text.get("1.0", "end-1c")
-        
-        # Process line by line
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            if not line.strip():
-                html_parts.append("<p>&nbsp;</p>")
-                continue
-            
-            line_start = f"{line_num}.0"
-            line_end = f"{line_num}.end"
-            
-            # Check for headings
-            tags = self.text.tag_names(line_start)
-            
-            if "h1" in tags:
-                html_parts.append(f"<h1>{self.escape_html(line)}</h1>")
-            elif "h2" in tags:
-                html_parts.append(f"<h2>{self.escape_html(line)}</h2>")
-            elif "h3" in tags:
-                html_parts.append(f"<h3>{self.escape_html(line)}</h3>")
-            elif "bullet" in tags:
-                # Simple bullet list handling
-                if not html_parts or not html_parts[-1].endswith("</ul>"):
-                    html_parts.append("<ul>")
-                html_parts.append(f"<li>{self.escape_html(line[2:])}</li>")
-                if line_num == len(lines) or "bullet" not in self.text.tag_names(f"{line_num+1}.0"):
-                    html_parts.append("</ul>")
-            elif "number" in tags:
-                # Simple numbered list handling
-                if not html_parts or not html_parts[-1].endswith("</ol>"):
-                    html_parts.append("<ol>")
-                html_parts.append(f"<li>{self.escape_html(line[3:])}</li>")
-                if line_num == len(lines) or "number" not in self.text.tag_names(f"{line_num+1}.0"):
-                    html_parts.append("</ol>")
-            else:
-                # Regular paragraph with inline formatting
-                formatted_line = self.process_inline_formatting(line, line_num)
-                html_parts.append(f"<p>{formatted_line}</p>")
-        
-        return '\n'.join(html_parts)
+        return self.get_document().to_storage()
     
-    def process_inline_formatting(self, text, line_num):
-        """Process inline formatting (bold, italic, underline)"""
-        # This is a simplified version - in production, you'd want more sophisticated parsing
-        result = self.escape_html(text)
-        
-        # Check each character for formatting
-        formatted_parts = []
-        i = 0
-        
-        while i < len(text):
-            char_index = f"{line_num}.{i}"
-            tags = self.text.tag_names(char_index)
-            
-            format_start = []
-            format_end = []
-            
-            if "bold" in tags:
-                format_start.append("<strong>")
-                format_end.append("</strong>")
-            if "italic" in tags:
-                format_start.append("<em>")
-                format_end.append("</em>")
-            if "underline" in tags:
-                format_start.append("<u>")
-                format_end.append("</u>")
-            
-            # Find the end of this formatting
-            j = i
-            while j < len(text) and set(self.text.tag_names(f"{line_num}.{j}")) == set(tags):
-                j += 1
-            
-            # Add formatted text
-            formatted_text = ''.join(format_start) + self.escape_html(text[i:j]) + ''.join(reversed(format_end))
-            formatted_parts.append(formatted_text)
-            
-            i = j
+    def set_document(self, document):
+        """Show a Document in the editor; returns what was simplified"""
+        text_content, ranges = document.to_editor()
         
-        return ''.join(formatted_parts) if formatted_parts else result
-    
-    def set_content_from_html(self, html_content):
-        """Load HTML content into the editor (basic implementation)"""
         # Clear current content
         self.text.delete("1.0", tk.END)
         
-        # Basic HTML to text conversion
-        # Remove HTML tags for now (in production, you'd parse and apply formatting)
-        text_content = re.sub('<[^<]+?>', '', html_content)
-        text_content = text_content.replace('&nbsp;', ' ')
-        text_content = text_content.replace('&amp;', '&')
-        text_content = text_content.replace('&lt;', '<')
-        text_content = text_content.replace('&gt;', '>')
-        
+        # One insert for the text, then each tag's ranges in a few batched calls
         self.text.insert("1.0", text_content)
+        for tag, indices in ranges.items():
+            for i in range(0, len(indices), TAG_BATCH_SIZE):
+                self.text.tag_add(tag, *indices[i:i + TAG_BATCH_SIZE])
+        
+        return document.simplified
     
-    def escape_html(self, text):
-        """Escape HTML special characters"""
-        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    def set_content_from_html(self, html_content):
+        """Load storage-format HTML into the editor, keeping its formatting"""
+        return self.set_document(Document.from_storage(html_content))
     
     def create_tooltip(self, widget, text):
         """Create tooltip for widget"""
@@ -569,22 +2694,397 @@ class RichTextEditor(tk.Frame):
         widget.bind("<Leave>", on_leave)
 
 
+class PageResultsList(tk.Frame):
+    """Sortable page list backed by a ttk.Treeview.
+    
+    Rows are inserted RESULTS_CHUNK at a time as the list is scrolled, so
+    tens of thousands of results cost no more to show than a screenful.
+    Double-click, Enter or the action button runs on_action(page). With
+    multiple=True several rows can be selected with Shift and Ctrl.
+    """
+    
+    COLUMNS = (
+        ("title", "Title", 420),
+        ("date", "Date", 100),
+        ("manager", "Manager", 160),
+        ("modified", "Last Modified", 150),
+        ("excerpt", "Match", 360),
+    )
+    
+    def __init__(self, parent, action_text, on_action, action_bg="#4CAF50", multiple=False, **kwargs):
+        super().__init__(parent, bg="white", **kwargs)
+        self.on_action = on_action
+        self.rows = []  # (sort values, page) in display order
+        self.shown = 0  # rows inserted into the tree so far
+        self.sort_column = "date"
+        self.sort_descending = True
+        
+        self.count_label = tk.Label(self, text="", font=("Arial", 10), bg="white")
+        self.count_label.pack(anchor="w", pady=5)
+        
+        tree_frame = tk.Frame(self, bg="white")
+        tree_frame.pack(fill="both", expand=True)
+        
+        self.tree = ttk.Treeview(tree_frame, columns=[c for c, _, _ in self.COLUMNS],
+                                 show="headings", selectmode="extended" if multiple else "browse",
+                                 height=10)
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=lambda first, last: self.on_scroll(scrollbar, first, last))
+        
+        for column, heading, width in self.COLUMNS:
+            self.tree.heading(column, text=heading, command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=width, stretch=column == "title")
+        self.update_headings()
+        
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        self.tree.bind("<Double-1>", lambda e: self.activate())
+        self.tree.bind("<Return>", lambda e: self.activate())
+        
+        if action_text:
+            tk.Button(
+                self,
+                text=action_text,
+                command=self.activate,
+                bg=action_bg,
+                fg="white"
+            ).pack(anchor="e", pady=5)
+    
+    def set_pages(self, pages):
+        """Replace the listed pages"""
+        self.rows = []
+        for page in pages:
+            page_date, manager = parse_handoff_title(page['title'])
+            modified = (page.get('version') or {}).get('when') or ""
+            values = {
+                "title": page['title'],
+                "date": page_date or "",
+                "manager": manager or "",
+                "modified": modified[:16].replace("T", " "),
+                "excerpt": page.get('excerpt', ""),
+            }
+            self.rows.append((values, page))
+        
+        # The Match column is only shown for full-text results
+        columns = [c for c, _, _ in self.COLUMNS]
+        if not any('excerpt' in page for _, page in self.rows):
+            columns.remove("excerpt")
+        self.tree.configure(displaycolumns=columns)
+        
+        self.count_label.config(
+            text=f"Found {len(self.rows)} page(s):" if self.rows else "No pages found",
+            fg="black" if self.rows else "gray"
+        )
+        self.sort_rows()
+    
+    def sort_by(self, column):
+        """Sort on a column; clicking the sorted column again reverses it"""
+        if column == self.sort_column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = column != "title"
+        self.update_headings()
+        self.sort_rows()
+    
+    def update_headings(self):
+        """Mark the sorted column's heading with an arrow"""
+        for column, heading, _ in self.COLUMNS:
+            if column == self.sort_column:
+                heading += " ▼" if self.sort_descending else " ▲"
+            self.tree.heading(column, text=heading)
+    
+    def sort_rows(self):
+        """Re-order the rows and show the first chunk"""
+        # Title breaks ties so equal dates or managers keep a stable order
+        self.rows.sort(key=lambda row: (row[0][self.sort_column], row[0]["title"]),
+                       reverse=self.sort_descending)
+        
+        self.tree.delete(*self.tree.get_children())
+        self.shown = 0
+        self.load_more()
+        self.tree.yview_moveto(0)
+    
+    def load_more(self):
+        """Insert the next chunk of rows"""
+        end = min(self.shown + RESULTS_CHUNK, len(self.rows))
+        for i in range(self.shown, end):
+            values = self.rows[i][0]
+            self.tree.insert("", "end", iid=str(i), values=[values[c] for c, _, _ in self.COLUMNS])
+        self.shown = end
+    
+    def on_scroll(self, scrollbar, first, last):
+        """Update the scrollbar and insert more rows near the bottom"""
+        scrollbar.set(first, last)
+        if self.shown < len(self.rows) and float(last) > 0.9:
+            self.after_idle(self.load_more)
+    
+    def selected_page(self):
+        """The selected page, or None"""
+        selection = self.tree.selection()
+        return self.rows[int(selection[0])][1] if selection else None
+    
+    def selected_pages(self):
+        """All selected pages, in display order"""
+        return [self.rows[i][1] for i in sorted(int(iid) for iid in self.tree.selection())]
+    
+    def select_all(self):
+        """Select every listed page, inserting any rows not shown yet"""
+        while self.shown < len(self.rows):
+            self.load_more()
+        self.tree.selection_set(self.tree.get_children())
+    
+    def activate(self):
+        """Run the action on the selected page"""
+        page = self.selected_page()
+        if page:
+            self.on_action(page)
+
+
+class BackgroundTask:
+    """Handle for work submitted to a TaskRunner"""
+    
+    def __init__(self, group=None, on_success=None, on_error=None, on_cancel=None, cancellable=True):
+        self.group = group
+        self.cancellable = cancellable
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.future = None
+        self.cancel_event = threading.Event()
+    
+    def is_cancelled(self):
+        """True once the task has been cancelled"""
+        return self.cancel_event.is_set()
+
+
+class TaskRunner:
+    """Run blocking calls on worker threads and hand results back to Tk.
+    
+    Callbacks always run on the Tk thread: workers put their results on a
+    queue which is drained with after(). Cancelling a task drops its
+    result; tasks that have not started yet are not run at all.
+    """
+    
+    def __init__(self, root, max_workers=4, on_busy_change=None):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="handoff")
+        self.results = queue.Queue()
+        self.active = set()
+        self.groups = {}
+        self.on_busy_change = on_busy_change
+        self.running = True
+        self.root.after(50, self.poll)
+    
+    def submit(self, func, *args, on_success=None, on_error=None, on_cancel=None, group=None,
+               cancellable=True):
+        """Run func(*args) in the background.
+        
+        Submitting a task with a group cancels the previous task of the
+        same group, so only the latest search or load delivers results.
+        Tasks submitted with cancellable=False (writes whose outcome the
+        user must see) are left alone by cancel_all.
+        """
+        if group and group in self.groups:
+            self.cancel(self.groups[group])
+        
+        task = BackgroundTask(group, on_success, on_error, on_cancel, cancellable)
+        if group:
+            self.groups[group] = task
+        self.active.add(task)
+        task.future = self.executor.submit(self.run_task, task, func, args)
+        self.notify_busy()
+        return task
+    
+    def run_task(self, task, func, args):
+        """Worker side: run the call and queue its outcome"""
+        if task.is_cancelled():
+            return
+        try:
+            # Client calls made by func give up early once the task is cancelled
+            self.results.put((task, True, run_with_cancel_event(task.cancel_event, func, *args)))
+        except Exception as e:
+            self.results.put((task, False, e))
+    
+    def poll(self):
+        """Deliver finished results on the Tk thread"""
+        if not self.running:
+            return
+        
+        try:
+            while True:
+                try:
+                    task, ok, value = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                
+                self.finish(task)
+                if task.is_cancelled():
+                    continue
+                # A failing callback must not stop the delivery of other results
+                try:
+                    if ok:
+                        if task.on_success:
+                            task.on_success(value)
+                    elif task.on_error:
+                        task.on_error(value)
+                    else:
+                        print(f"Background task failed: {value}")
+                except Exception as e:
+                    print(f"Error handling background task result: {e!r}")
+        finally:
+            self.root.after(50, self.poll)
+    
+    def finish(self, task):
+        """Forget a task that is done or cancelled"""
+        self.active.discard(task)
+        if task.group and self.groups.get(task.group) is task:
+            del self.groups[task.group]
+        self.notify_busy()
+    
+    def cancel(self, task):
+        """Cancel a task; its on_cancel callback runs straight away"""
+        if task.is_cancelled() or task not in self.active:
+            return
+        task.cancel_event.set()
+        task.future.cancel()
+        self.finish(task)
+        if task.on_cancel:
+            task.on_cancel()
+    
+    def cancel_all(self):
+        """Cancel every pending and in-flight task that can be cancelled"""
+        for task in list(self.active):
+            if task.cancellable:
+                self.cancel(task)
+    
+    def notify_busy(self):
+        """Report the number of tasks in flight"""
+        if self.on_busy_change:
+            self.on_busy_change(len(self.active))
+    
+    def shutdown(self):
+        """Stop delivering results and release the worker threads"""
+        self.running = False
+        for task in list(self.active):
+            task.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
 class ConfluenceEditor(tk.Tk):
     """Main GUI Application"""
     
-    def __init__(self, confluence_client, manager_name):
+    def __init__(self, confluence_client, manager_name, snapshots=None, write_queue=None, drafts=None):
         super().__init__()
         self.client = confluence_client
         self.manager_name = manager_name
+        self.snapshots = snapshots
+        self.write_queue = write_queue
+        self.drafts = drafts
+        self.replay_job = None  # after() id of the next queue retry
+        self.replaying = False
         self.has_write_permission = False
         self.current_page_data = {}  # Store current page data for editing
+        self.yesterday_shown = None  # (page id, version) on the yesterday tab
+        self.connected = False
+        self.connect_started = None
+        self.today_prefetched = False
+        self.type_ahead_jobs = {}  # search group -> pending after() id
         
         self.title(f"Confluence Handoff Manager - {manager_name}")
         self.geometry("1100x800")
         self.configure(bg="white")
         
+        # All Confluence calls run on worker threads so the window never freezes
+        self.tasks = TaskRunner(self, on_busy_change=self.show_busy)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         self.setup_ui()
+        self.update_queue_status()
+        mark_startup("window build")
+        
+        if self.drafts:
+            self.after(AUTOSAVE_SECONDS * 1000, self.autosave)
+            self.tasks.submit(self.drafts.load_all, on_success=self.offer_draft_recovery)
+        self.after(0, self.report_startup)
+        
+        # Type-ahead answers from titles already in the local index, even before connecting
+        self.tasks.submit(self.client.refresh_titles, on_success=lambda _: self.refresh_type_ahead())
+        self.connect()
+    
+    def connect(self, attempt=0):
+        """Authenticate while probing Confluence health in parallel.
+        
+        A successful user lookup means Confluence is ready, so start-up
+        costs a single round trip. A 401 or 403 means a bad token; any
+        other failure (unreachable, throttled, server error) is retried
+        with backoff, the health probe telling which it was.
+        """
+        if attempt == 0:
+            self.connect_started = time.time()
+            self.status_label.config(text="🌐 Connecting to Confluence...", fg="black")
+        
+        # Start-up must finish connecting, so these are left out of Cancel
+        state = {"attempt": attempt}
+        self.tasks.submit(
+            self.client.get_current_user,
+            on_success=lambda user: self.on_connect_result(state, "user", user),
+            cancellable=False
+        )
+        self.tasks.submit(
+            self.client.check_health,
+            on_success=lambda healthy: self.on_connect_result(state, "healthy", healthy),
+            cancellable=False
+        )
+    
+    def on_connect_result(self, state, key, value):
+        """Combine the user lookup and health probe results"""
+        if self.connected:
+            return
+        state[key] = value
+        
+        user, status = state.get("user", (None, None))
+        if user:
+            self.connected = True
+            self.on_connected(user)
+            return
+        if status in (401, 403):
+            self.status_label.config(
+                text="❌ Confluence is reachable but authentication failed - check your PAT",
+                fg="red"
+            )
+            return
+        if "user" not in state or "healthy" not in state:
+            return
+        
+        if time.time() - self.connect_started > CONNECT_TIMEOUT:
+            if state["healthy"]:
+                self.status_label.config(text=f"❌ Could not sign in to Confluence (status {status})", fg="red")
+            else:
+                self.status_label.config(text="❌ Could not reach Confluence", fg="red")
+            self.handoff_freshness_label.config(text="⚠ Offline - showing saved copy", fg="#e65100")
+            return
+        
+        # Short exponential backoff with jitter
+        attempt = state["attempt"] + 1
+        delay = min(0.5 * 2 ** state["attempt"], 10) * random.uniform(0.8, 1.2)
+        problem = f"Confluence is busy (status {status or 'no answer'})" if state["healthy"] else "Confluence not reachable"
+        self.status_label.config(
+            text=f"⚠ {problem} - retrying in {delay:.0f}s (attempt {attempt + 1})",
+            fg="#e65100"
+        )
+        self.after(int(delay * 1000), lambda: self.connect(attempt))
+    
+    def on_connected(self, user):
+        """Start loading data once Confluence can be reached"""
+        print(f"✅ Authenticated as: {user.get('displayName', 'Unknown')}")
+        
+        self.status_label.config(text="Checking permissions...", fg="black")
         self.check_permissions()
+        self.load_yesterdays_handoff()
+        self.reconcile_index(self.refresh_type_ahead)
+        self.replay_queue()
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -598,47 +3098,200 @@ class ConfluenceEditor(tk.Tk):
             font=("Arial", 10, "bold"),
             bg="white"
         )
-        self.status_label.pack(anchor="w")
+        self.status_label.pack(side="left", anchor="w")
+        
+        # Changes saved locally while Confluence was unreachable; click for details
+        self.queue_label = tk.Label(
+            self.status_frame,
+            text="",
+            font=("Arial", 9),
+            bg="white",
+            cursor="hand2"
+        )
+        self.queue_label.pack(side="left", padx=15)
+        self.queue_label.bind("<Button-1>", lambda e: self.show_queue_details())
+        
+        # Progress indicator for background work (shown only while busy)
+        self.cancel_btn = tk.Button(
+            self.status_frame,
+            text="✖ Cancel",
+            command=self.cancel_tasks,
+            font=("Arial", 9),
+            bg="#f0f0f0"
+        )
+        self.progress = ttk.Progressbar(self.status_frame, mode="indeterminate", length=120)
+        self.busy_shown = False
+        self.progress_label = tk.Label(
+            self.status_frame,
+            text="",
+            font=("Arial", 9),
+            bg="white",
+            fg="gray"
+        )
         
         # Main content area with notebook
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill="both", expand=True, padx=10, pady=5)
         
-        # Tab 1: Yesterday's Handoff
+        # Tab 1: Yesterday's Handoff (visible first, so built straight away)
         self.handoff_frame = tk.Frame(self.notebook, bg="white")
         self.notebook.add(self.handoff_frame, text="📋 Yesterday's Handoff")
         self.setup_handoff_tab()
         
+        # The other tabs are built the first time they are selected
+        self.tab_builders = {}
+        
         # Tab 2: Search & Edit
         self.search_frame = tk.Frame(self.notebook, bg="white")
         self.notebook.add(self.search_frame, text="🔍 Search & Edit")
-        self.setup_search_tab()
+        self.tab_builders[str(self.search_frame)] = self.setup_search_tab
         
         # Tab 3: Create Page
         self.create_frame = tk.Frame(self.notebook, bg="white")
         self.notebook.add(self.create_frame, text="➕ Create Page")
-        self.setup_create_tab()
+        self.tab_builders[str(self.create_frame)] = self.setup_create_tab
         
         # Tab 4: Delete Page
         self.delete_frame = tk.Frame(self.notebook, bg="white")
         self.notebook.add(self.delete_frame, text="🗑️ Delete Page")
-        self.setup_delete_tab()
+        self.tab_builders[str(self.delete_frame)] = self.setup_delete_tab
+        
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.ensure_tab(self.notebook.select()))
+    
+    def ensure_tab(self, frame):
+        """Build a tab's widgets if that has not happened yet"""
+        builder = self.tab_builders.pop(str(frame), None)
+        if builder:
+            started = time.perf_counter()
+            builder()
+            print(f"⏱ Built {self.notebook.tab(frame, 'text')} tab in {time.perf_counter() - started:.3f}s")
+    
+    def report_startup(self):
+        """Print the start-up timing report once the window has been drawn"""
+        self.update_idletasks()
+        mark_startup("first paint")
+        print(startup_report())
+    
+    def yesterday_title(self):
+        """Title of yesterday's handoff page for this manager"""
+        yesterday = datetime.now() - timedelta(days=1)
+        return f"{yesterday.strftime('%d-%m-%Y')}_Handoff_{self.manager_name}"
+    
+    def show_cached_handoff(self):
+        """Paint the last saved copy of yesterday's page straight away"""
+        snapshot = self.snapshots.get(self.yesterday_title()) if self.snapshots else None
+        if not snapshot:
+            return
+        
+        self.render_yesterdays_handoff(snapshot['page'], snapshot['html'], snapshot['version'])
+        self.handoff_freshness_label.config(
+            text=f"⏳ Showing saved copy from {snapshot['saved_at']} - refreshing...",
+            fg="#e65100"
+        )
+    
+    def load_yesterdays_handoff(self):
+        """Load and display yesterday's handoff page"""
+        if self.yesterday_shown:
+            # Keep the current copy on screen while revalidating it
+            self.handoff_freshness_label.config(text="🔄 Checking for changes...", fg="gray")
+        else:
+            # Clear previous results
+            for widget in self.handoff_results_frame.winfo_children():
+                widget.destroy()
+            
+            tk.Label(
+                self.handoff_results_frame,
+                text="Loading yesterday's handoff...",
+                font=("Arial", 11),
+                bg="white",
+                fg="gray"
+            ).pack(pady=20)
+        
+        self.tasks.submit(
+            self.fetch_yesterdays_handoff, self.yesterday_shown,
+            on_success=self.show_yesterdays_handoff,
+            group="yesterday"
+        )
+    
+    def fetch_yesterdays_handoff(self, shown):
+        """Find yesterday's page and its content (runs on a worker thread).
+        
+        shown is the (page id, version) already on screen, if any. When it
+        is still current only a metadata probe is made. Returns
+        (page, page_data, changed); when the refresh fails with a copy on
+        screen, page_data is None and changed is False so the copy stays.
+        """
+        # Get yesterday's handoff page for the manager
+        handoff_pages = self.client.get_yesterdays_handoff(self.manager_name)
+        if not handoff_pages:
+            # Nothing found may just mean the lookup failed; keep any copy shown
+            return None, None, not shown
+        
+        page = handoff_pages[0]  # Take the first (and should be only) page
+        if shown and shown[0] == page['id']:
+            metadata = self.client.fetch_page_content(page['id'], "metadata")
+            if metadata is None:
+                return page, None, False
+            if metadata['version']['number'] == shown[1]:
+                return page, metadata, False
+        
+        page_data = self.client.fetch_page_content(page['id'], "view")
+        if page_data is None and shown:
+            return page, None, False
+        if page_data and self.snapshots:
+            self.snapshots.put(page, page_data)
+        return page, page_data, True
+    
+    def show_yesterdays_handoff(self, result):
+        """Display yesterday's handoff page, unless the copy shown is current"""
+        page, page_data, changed = result
+        checked = datetime.now().strftime("%H:%M")
+        
+        if changed:
+            html = page_data['body']['view']['value'] if page_data else None
+            version = page_data['version']['number'] if page_data else None
+            self.render_yesterdays_handoff(page, html, version)
+        
+        if page_data:
+            self.handoff_freshness_label.config(text=f"✓ Up to date (checked {checked})", fg="green")
+        elif self.yesterday_shown:
+            self.handoff_freshness_label.config(
+                text=f"⚠ Could not refresh (tried {checked}) - showing saved copy", fg="#e65100"
+            )
+        else:
+            self.handoff_freshness_label.config(text="")
+        
+        # Warm tomorrow's start-up with today's page
+        if self.snapshots and not self.today_prefetched:
+            self.today_prefetched = True
+            self.tasks.submit(self.prefetch_todays_handoff)
+    
+    def prefetch_todays_handoff(self):
+        """Save a copy of today's page for the next launch (runs on a worker thread)"""
+        title = f"{datetime.now().strftime('%d-%m-%Y')}_Handoff_{self.manager_name}"
+        page = self.client.get_page_by_title(title)
+        if not page:
+            return
+        
+        snapshot = self.snapshots.get(title)
+        if snapshot and snapshot['version'] == page['version']['number']:
+            return
+        
+        page_data = self.client.fetch_page_content(page['id'], "view")
+        if page_data:
+            self.snapshots.put(page, page_data)
     
-    def load_yesterdays_handoff(self):
-        """Load and display yesterday's handoff page"""
+    def render_yesterdays_handoff(self, page, html, version):
+        """Draw yesterday's page (or a not-found message) in the tab"""
+        self.yesterday_shown = (page['id'], version) if page and html is not None else None
+        
         # Clear previous results
         for widget in self.handoff_results_frame.winfo_children():
             widget.destroy()
         
-        # Get yesterday's date
-        yesterday = datetime.now() - timedelta(days=1)
-        date_str = yesterday.strftime("%d-%m-%Y")
-        expected_title = f"{date_str}_Handoff_{self.manager_name}"
-        
-        # Get yesterday's handoff page for the manager
-        handoff_pages = self.client.get_yesterdays_handoff(self.manager_name)
+        expected_title = self.yesterday_title()
         
-        if not handoff_pages:
+        if not page:
             # No page found
             no_page_frame = tk.Frame(self.handoff_results_frame, bg="white")
             no_page_frame.pack(fill="both", expand=True, pady=20)
@@ -660,8 +3313,6 @@ class ConfluenceEditor(tk.Tk):
             ).pack()
         else:
             # Found the page - directly display its content
-            page = handoff_pages[0]  # Take the first (and should be only) page
-            
             # Header frame with page info and buttons
             header_frame = tk.Frame(self.handoff_results_frame, bg="white", relief="ridge", bd=1)
             header_frame.pack(fill="x", padx=10, pady=5)
@@ -695,14 +3346,10 @@ class ConfluenceEditor(tk.Tk):
             # Content display frame
             content_frame = tk.Frame(self.handoff_results_frame, bg="white")
             content_frame.pack(fill="both", expand=True, padx=10, pady=10)
-         
-
-            # Fetch and display the page content
-            page_data = self.client.fetch_page_content(page['id'])
             
-            if page_data:
+            if html is not None:
                 # Create scrollable HTML view
-                html_view = HTMLLabel(content_frame, html=page_data['body']['view']['value'], height=60)
+                html_view = html_label(content_frame, html=html, height=60)
                 html_view.pack(fill="both", expand=True)
             else:
                 tk.Label(
@@ -733,6 +3380,15 @@ class ConfluenceEditor(tk.Tk):
             bg="#f0f0f0"
         ).pack(pady=5)
         
+        # Whether the page shown is a saved copy or freshly checked
+        self.handoff_freshness_label = tk.Label(
+            self.handoff_frame,
+            text="",
+            font=("Arial", 9),
+            bg="white"
+        )
+        self.handoff_freshness_label.pack()
+        
         # Create a canvas and scrollbar for scrolling
         canvas_frame = tk.Frame(self.handoff_frame)
         canvas_frame.pack(fill="both", expand=True, padx=10, pady=5)
@@ -752,8 +3408,8 @@ class ConfluenceEditor(tk.Tk):
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Load yesterday's handoff on startup
-        self.after(100, self.load_yesterdays_handoff)
+        # Show the saved copy now; the refresh runs once we are connected
+        self.show_cached_handoff()
 
 
     # For Search & Edit tab, replace the setup_search_tab method:
@@ -795,6 +3451,7 @@ class ConfluenceEditor(tk.Tk):
             width=80
         )
         self.search_entry.pack(side="left", padx=5)
+        self.search_var.trace_add("write", lambda *_: self.schedule_type_ahead("search", self.refresh_search_results))
         
         tk.Button(
             search_input_frame,
@@ -805,9 +3462,35 @@ class ConfluenceEditor(tk.Tk):
             fg="white"
         ).pack(side="left", padx=5)
         
+        # Title or full-text search, the latter limited to recent pages
+        search_mode_frame = tk.Frame(search_container, bg="white")
+        search_mode_frame.pack(fill="x", pady=5)
+        
+        self.search_mode = tk.StringVar(value="title")
+        tk.Radiobutton(
+            search_mode_frame, text="Titles", variable=self.search_mode, value="title",
+            command=self.refresh_search_results, bg="white"
+        ).pack(side="left", padx=5)
+        tk.Radiobutton(
+            search_mode_frame, text="Page text (e.g. INC-12345)", variable=self.search_mode, value="body",
+            command=self.refresh_search_results, bg="white"
+        ).pack(side="left", padx=5)
+        
+        tk.Label(search_mode_frame, text="in the last", bg="white").pack(side="left", padx=(15, 2))
+        self.search_days_var = tk.StringVar(value=str(BODY_INDEX_DAYS or ""))
+        tk.Spinbox(
+            search_mode_frame, from_=0, to=3650, width=5,
+            textvariable=self.search_days_var, command=self.refresh_search_results
+        ).pack(side="left")
+        tk.Label(search_mode_frame, text="days (0 = all)", bg="white").pack(side="left", padx=2)
+        
         # Search results
-        self.search_results_frame = tk.Frame(scrollable_frame, bg="white")
-        self.search_results_frame.pack(fill="x", padx=20, pady=10)
+        self.search_results = PageResultsList(
+            scrollable_frame,
+            action_text="Edit",
+            on_action=lambda page: self.load_page_for_editing(page['id'], page['title'])
+        )
+        self.search_results.pack(fill="x", padx=20, pady=10)
         
         # Separator
         ttk.Separator(scrollable_frame, orient="horizontal").pack(fill="x", padx=20, pady=10)
@@ -910,19 +3593,34 @@ class ConfluenceEditor(tk.Tk):
             self.html_editor_frame.pack_forget()
             self.wysiwyg_editor.pack(fill="both", expand=True)
             
-            # If there's content in HTML editor, try to load it
+            # If there's content in HTML editor, parse it in the background and load it
             html_content = self.html_editor.get("1.0", tk.END).strip()
             if html_content:
-                self.wysiwyg_editor.set_content_from_html(html_content)
+                modified = self.editors_modified()
+                self.tasks.submit(
+                    Document.from_storage, html_content,
+                    on_success=lambda document: self.show_converted_document(document, modified),
+                    group="convert"
+                )
         else:
             # Switch to HTML
             self.wysiwyg_editor.pack_forget()
             self.html_editor_frame.pack(fill="both", expand=True)
             
             # Convert WYSIWYG content to HTML
+            modified = self.editors_modified()
             html_content = self.wysiwyg_editor.get_html_content()
             self.html_editor.delete("1.0", tk.END)
             self.html_editor.insert("1.0", html_content)
+            # Switching views is not an edit; only carry over real unsaved changes
+            if not modified:
+                self.mark_editors_saved()
+    
+    def show_converted_document(self, document, modified):
+        """Show the HTML editor's content in the visual editor after a mode switch"""
+        self.show_document(document)
+        if not modified:
+            self.mark_editors_saved()
     
     def setup_create_tab(self):
         """Setup create page interface"""
@@ -1005,6 +3703,55 @@ class ConfluenceEditor(tk.Tk):
             bg="white"
         )
         self.create_status_label.pack(pady=10)
+        
+        # Bulk creation of a rota's pages for a date range
+        bulk_frame = tk.LabelFrame(
+            create_container,
+            text="Bulk Create (Rota)",
+            font=("Arial", 11, "bold"),
+            bg="white",
+            padx=10,
+            pady=10
+        )
+        bulk_frame.pack(fill="both", expand=True, pady=10)
+        
+        # Default to next month
+        next_month = (datetime.now().replace(day=1) + timedelta(days=32)).replace(day=1)
+        month_end = (next_month + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        
+        range_frame = tk.Frame(bulk_frame, bg="white")
+        range_frame.pack(fill="x", pady=5)
+        tk.Label(range_frame, text="From (DD-MM-YYYY):", bg="white").pack(side="left", padx=5)
+        self.bulk_from_var = tk.StringVar(value=next_month.strftime("%d-%m-%Y"))
+        tk.Entry(range_frame, textvariable=self.bulk_from_var, width=12).pack(side="left", padx=5)
+        tk.Label(range_frame, text="To:", bg="white").pack(side="left", padx=5)
+        self.bulk_to_var = tk.StringVar(value=month_end.strftime("%d-%m-%Y"))
+        tk.Entry(range_frame, textvariable=self.bulk_to_var, width=12).pack(side="left", padx=5)
+        
+        tk.Label(
+            bulk_frame,
+            text="Managers: comma separated for every day, or one per line as \"Name: Mon, Wed, Fri\"",
+            bg="white",
+            fg="gray"
+        ).pack(anchor="w", pady=(5, 0))
+        self.bulk_rota_text = tk.Text(bulk_frame, height=4, font=("Arial", 10))
+        self.bulk_rota_text.pack(fill="x", pady=5)
+        
+        self.bulk_create_btn = tk.Button(
+            bulk_frame,
+            text="📅 Create Rota Pages",
+            command=self.create_rota_pages,
+            font=("Arial", 10, "bold"),
+            bg="#2196F3",
+            fg="white"
+        )
+        self.bulk_create_btn.pack(pady=5)
+        
+        self.bulk_status_label = tk.Label(bulk_frame, text="", font=("Arial", 10), bg="white")
+        self.bulk_status_label.pack()
+        
+        self.bulk_results = scrolledtext.ScrolledText(bulk_frame, height=8, font=("Consolas", 9))
+        self.bulk_results.pack(fill="both", expand=True, pady=5)
     
     def setup_delete_tab(self):
         """Setup delete page interface"""
@@ -1033,7 +3780,7 @@ class ConfluenceEditor(tk.Tk):
         # Search for page to delete
         tk.Label(
             delete_container,
-            text="Search for page to delete:",
+            text="Search for pages to delete or archive:",
             font=("Arial", 11),
             bg="white"
         ).pack(pady=10)
@@ -1042,6 +3789,9 @@ class ConfluenceEditor(tk.Tk):
         delete_search_frame.pack(pady=5)
         
         self.delete_search_var = tk.StringVar()
+        self.delete_search_var.trace_add(
+            "write", lambda *_: self.schedule_type_ahead("delete_search", self.refresh_deletion_results)
+        )
         tk.Entry(
             delete_search_frame,
             textvariable=self.delete_search_var,
@@ -1057,108 +3807,184 @@ class ConfluenceEditor(tk.Tk):
             bg="#f0f0f0"
         ).pack(side="left", padx=5)
         
-        # Results for deletion
-        self.delete_results_frame = tk.Frame(delete_container, bg="white")
-        self.delete_results_frame.pack(fill="both", expand=True, pady=10)
+        # Results for deletion; Shift/Ctrl-click selects several pages
+        self.delete_results = PageResultsList(
+            delete_container,
+            action_text=None,
+            on_action=lambda page: self.remove_pages([page], "delete"),
+            multiple=True
+        )
+        self.delete_results.pack(fill="both", expand=True, pady=10)
+        
+        remove_frame = tk.Frame(delete_container, bg="white")
+        remove_frame.pack(fill="x", pady=5)
+        
+        tk.Button(
+            remove_frame,
+            text="Select All",
+            command=self.delete_results.select_all,
+            font=("Arial", 10),
+            bg="#f0f0f0"
+        ).pack(side="left", padx=5)
+        
+        self.dry_run_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            remove_frame,
+            text="Dry run (only report what would change)",
+            variable=self.dry_run_var,
+            bg="white"
+        ).pack(side="left", padx=10)
+        
+        self.archive_btn = tk.Button(
+            remove_frame,
+            text="📦 Archive Selected",
+            command=lambda: self.remove_selected_pages("archive"),
+            font=("Arial", 10, "bold"),
+            bg="#FF9800",
+            fg="white",
+            state="normal" if ARCHIVE_PAGE_ID else "disabled"
+        )
+        self.archive_btn.pack(side="right", padx=5)
+        
+        self.delete_btn = tk.Button(
+            remove_frame,
+            text="🗑️ Delete Selected",
+            command=lambda: self.remove_selected_pages("delete"),
+            font=("Arial", 10, "bold"),
+            bg="#f44336",
+            fg="white"
+        )
+        self.delete_btn.pack(side="right", padx=5)
+        
+        self.remove_status_label = tk.Label(delete_container, text="", font=("Arial", 10), bg="white")
+        self.remove_status_label.pack()
+        
+        self.remove_results = scrolledtext.ScrolledText(delete_container, height=6, font=("Consolas", 9))
+        self.remove_results.pack(fill="x", pady=5)
     
-    def search_pages(self):
-        """Search for pages"""
-        search_term = self.search_var.get()
+    def find_pages(self, search_term, on_success, group, typing=False):
+        """Answer a title search from memory when possible, else on a worker thread.
         
-        # Clear previous results
-        for widget in self.search_results_frame.winfo_children():
-            widget.destroy()
+        While typing only the in-memory index is used; the network is left to reconcile_index.
+        """
+        if self.client.titles.loaded:
+            on_success(self.client.titles.search(search_term))
+        elif not typing:
+            self.tasks.submit(self.client.find_pages, search_term, on_success=on_success, group=group)
+    
+    def schedule_type_ahead(self, group, search):
+        """Run search once typing has paused for TYPE_AHEAD_DELAY_MS"""
+        job = self.type_ahead_jobs.pop(group, None)
+        if job:
+            self.after_cancel(job)
         
-        # Search pages
-        pages = self.client.search_pages_by_title(search_term)
+        def run():
+            self.type_ahead_jobs.pop(group, None)
+            search(typing=True)
         
-        if not pages:
-            tk.Label(
-                self.search_results_frame,
-                text="No pages found",
-                font=("Arial", 10),
-                bg="white",
-                fg="gray"
-            ).pack(pady=10)
+        self.type_ahead_jobs[group] = self.after(TYPE_AHEAD_DELAY_MS, run)
+    
+    def refresh_type_ahead(self):
+        """Re-run searches that have a term typed, after the title index changed"""
+        if getattr(self, "search_var", None) is not None and self.search_var.get():
+            self.refresh_search_results()
+        if getattr(self, "delete_search_var", None) is not None and self.delete_search_var.get():
+            self.refresh_deletion_results()
+    
+    def search_pages(self):
+        """Search for pages"""
+        # Answer from the index now and refresh once it has been reconciled
+        self.refresh_search_results()
+        self.reconcile_index(self.refresh_search_results)
+    
+    def refresh_search_results(self, typing=False):
+        """Re-run the current search against the reconciled index"""
+        search_term = self.search_var.get()
+        if self.search_mode.get() != "body":
+            self.find_pages(search_term, self.show_search_results, "search", typing)
+        elif search_term.strip():
+            self.tasks.submit(
+                self.client.search_bodies, search_term, self.search_days(),
+                on_success=self.show_search_results,
+                group="search"
+            )
         else:
-            tk.Label(
-                self.search_results_frame,
-                text=f"Found {len(pages)} page(s):",
-                font=("Arial", 10),
-                bg="white"
-            ).pack(pady=5)
-            
-            # Display results
-            for page in pages[:10]:  # Limit to 10 results
-                result_frame = tk.Frame(self.search_results_frame, bg="white", relief="ridge", bd=1)
-                result_frame.pack(fill="x", pady=2)
-                
-                tk.Label(
-                    result_frame,
-                    text=page['title'],
-                    font=("Arial", 10),
-                    bg="white"
-                ).pack(side="left", padx=10, pady=5)
-                
-                tk.Button(
-                    result_frame,
-                    text="Edit",
-                    command=lambda p=page: self.load_page_for_editing(p['id'], p['title']),
-                    bg="#4CAF50",
-                    fg="white"
-                ).pack(side="right", padx=5, pady=2)
+            self.show_search_results([])
+    
+    def search_days(self):
+        """The body search's "last N days" limit, or None for all pages"""
+        try:
+            return max(0, int(self.search_days_var.get())) or None
+        except (ValueError, tk.TclError):
+            return None
+    
+    def show_search_results(self, pages):
+        """Display search results"""
+        self.search_results.set_pages(pages)
     
     def search_pages_for_deletion(self):
         """Search pages for deletion"""
-        search_term = self.delete_search_var.get()
+        # Answer from the index now and refresh once it has been reconciled
+        self.refresh_deletion_results()
+        self.reconcile_index(self.refresh_deletion_results)
+    
+    def refresh_deletion_results(self, typing=False):
+        """Re-run the current deletion search against the reconciled index"""
+        self.find_pages(self.delete_search_var.get(), self.show_deletion_results, "delete_search", typing)
+    
+    def show_deletion_results(self, pages):
+        """Display search results for deletion"""
+        self.delete_results.set_pages(pages)
+    
+    def reconcile_index(self, on_change=None):
+        """Sync the page index, then the body index, in the background, calling on_change if either changed"""
+        if not self.client.index:
+            return
         
-        # Clear previous results
-        for widget in self.delete_results_frame.winfo_children():
-            widget.destroy()
+        def on_indexed(changed):
+            if changed and on_change:
+                on_change()
         
-        # Search pages
-        pages = self.client.search_pages_by_title(search_term)
+        def on_synced(changed):
+            on_indexed(changed)
+            if changed is not None:
+                self.tasks.submit(self.client.sync_bodies, on_success=on_indexed)
         
-        if not pages:
-            tk.Label(
-                self.delete_results_frame,
-                text="No pages found",
-                font=("Arial", 10),
-                bg="white",
-                fg="gray"
-            ).pack(pady=10)
-        else:
-            # Display results
-            for page in pages[:10]:  # Limit to 10 results
-                result_frame = tk.Frame(self.delete_results_frame, bg="white", relief="ridge", bd=1)
-                result_frame.pack(fill="x", pady=2)
-                
-                tk.Label(
-                    result_frame,
-                    text=page['title'],
-                    font=("Arial", 10),
-                    bg="white"
-                ).pack(side="left", padx=10, pady=5)
-                
-                tk.Button(
-                    result_frame,
-                    text="🗑️ Delete",
-                    command=lambda p=page: self.delete_page(p['id'], p['title']),
-                    bg="#f44336",
-                    fg="white"
-                ).pack(side="right", padx=5, pady=2)
+        self.tasks.submit(self.client.sync_index, on_success=on_synced)
     
     def load_page_for_editing(self, page_id, title):
         """Load a page for editing"""
-        # Fetch page content
-        page_data = self.client.fetch_page_content(page_id)
+        self.ensure_tab(self.search_frame)
+        self.current_page_label.config(text=f"Loading: {title}...", fg="gray")
         
+        # Fetch (and for the visual editor, parse) the page in the background
+        self.tasks.submit(
+            self.fetch_for_editing, page_id, self.editor_mode.get() == "wysiwyg",
+            on_success=lambda result: self.show_page_for_editing(page_id, title, *result),
+            on_cancel=lambda: self.current_page_label.config(text="No page selected", fg="gray"),
+            group="edit"
+        )
+    
+    def fetch_for_editing(self, page_id, parse):
+        """Fetch a page's storage body and optionally parse it (runs on a worker thread)"""
+        page_data = self.client.fetch_page_content(page_id, "storage")
+        document = None
+        if page_data and parse:
+            document = Document.from_storage(page_data['body']['storage']['value'])
+        return page_data, document
+    
+    def show_page_for_editing(self, page_id, title, page_data, document=None):
+        """Put fetched page content into the editor"""
         if page_data:
+            # Keep unsaved edits to the page being replaced
+            self.autosave(reschedule=False)
+            
             # Store current page data
             self.current_page_data = {
                 'id': page_id,
                 'title': title,
-                'content': page_data['body']['storage']['value']
+                'content': page_data['body']['storage']['value'],
+                'version': page_data['version']['number']
             }
             
             # Update UI
@@ -1169,10 +3995,13 @@ class ConfluenceEditor(tk.Tk):
             
             # Load content into appropriate editor
             if self.editor_mode.get() == "wysiwyg":
-                self.wysiwyg_editor.set_content_from_html(self.current_page_data['content'])
+                if document is None:
+                    document = Document.from_storage(self.current_page_data['content'])
+                self.show_document(document)
             else:
                 self.html_editor.delete("1.0", tk.END)
                 self.html_editor.insert("1.0", self.current_page_data['content'])
+            self.mark_editors_saved()
             
             # Enable update button
             self.update_btn.config(state="normal")
@@ -1180,8 +4009,21 @@ class ConfluenceEditor(tk.Tk):
             # Switch to search tab
             self.notebook.select(1)
         else:
+            self.current_page_label.config(text="No page selected", fg="gray")
             messagebox.showerror("Error", "Failed to load page content")
     
+    def show_document(self, document):
+        """Show a parsed page in the visual editor, noting anything simplified"""
+        simplified = self.wysiwyg_editor.set_document(document)
+        
+        title = self.current_page_data.get('title')
+        if title:
+            text = f"Editing: {title}"
+            if simplified:
+                text += (f"  ⚠ {', '.join(sorted(simplified))} shown as plain text"
+                         f" - use the HTML Editor to keep them")
+            self.current_page_label.config(text=text, fg="#e65100" if simplified else "black")
+    
     def update_page_content(self):
         """Update the currently edited page"""
         if not self.current_page_data:
@@ -1198,21 +4040,91 @@ class ConfluenceEditor(tk.Tk):
             messagebox.showwarning("Warning", "Content cannot be empty")
             return
         
-        # Confirm update
-        if not messagebox.askyesno("Confirm", f"Update page '{self.current_page_data['title']}'?"):
+        # Diff against the loaded version in the background, then confirm
+        self.tasks.submit(
+            self.review_changes, self.current_page_data['content'], new_content,
+            self.editor_mode.get() == "wysiwyg",
+            on_success=lambda changes: self.confirm_update(new_content, changes)
+        )
+    
+    def review_changes(self, base_content, new_content, visual):
+        """Summarize an edit for confirmation, or None if it changes nothing (runs on a worker thread).
+        
+        Visual edits are compared with the loaded page as the visual editor
+        would save it, so content it simplifies does not count as a change.
+        """
+        baseline = Document.from_storage(base_content).to_storage() if visual else base_content
+        changes = summarize_changes(baseline, new_content)
+        if not changes:
+            return None
+        if visual and block_changes(base_content, baseline)[2]:
+            changes.append("Note: tables, macros and links the visual editor cannot keep will also be simplified.")
+        return changes
+    
+    def confirm_update(self, new_content, changes):
+        """Show what an update changes and save it if confirmed"""
+        title = self.current_page_data.get('title')
+        if not title:
+            return
+        
+        if changes is None:
+            # Saving would only bump the version and notify watchers
+            messagebox.showinfo("No Changes", f"'{title}' has not changed since it was loaded, so it was not saved.")
+            return
+        
+        if not messagebox.askyesno("Confirm", f"Update page '{title}'?\n\nChanges:\n" + "\n".join(changes)):
             return
         
-        # Update page
+        self.save_page(new_content)
+    
+    def save_page(self, new_content):
+        """Send content on top of the version the edit started from"""
         self.update_btn.config(state="disabled", text="Updating...")
-        self.update()
         
-        success, message = self.client.update_page_content(
+        self.tasks.submit(
+            self.client.update_page_content,
             self.current_page_data['id'],
             new_content,
-            self.current_page_data['title']
+            self.current_page_data['title'],
+            self.current_page_data['version'],
+            on_success=lambda result: self.show_update_result(result, new_content),
+            on_error=lambda e: self.show_update_result((False, f"Error updating page: {e}"), new_content),
+            # Once sent, the update may already be saved, so always report how it ended
+            cancellable=False
         )
+    
+    def show_update_result(self, result, new_content):
+        """Report the outcome of a page update"""
+        success, message = result
         
-        if success:
+        if message == VERSION_CONFLICT:
+            # Someone saved in the meantime: fetch their version and resolve
+            self.tasks.submit(
+                self.client.fetch_page_content, self.current_page_data['id'], "storage",
+                on_success=lambda latest: self.resolve_conflict(new_content, latest)
+            )
+        elif message == CONNECTION_LOST and self.write_queue:
+            # Keep the edit on disk and send it once Confluence is back
+            self.discard_draft()
+            self.write_queue.add(
+                "update", self.current_page_data['title'], new_content,
+                page_id=self.current_page_data['id'],
+                base_version=self.current_page_data['version'],
+                base_content=self.current_page_data['content']
+            )
+            self.update_queue_status()
+            self.schedule_replay()
+            messagebox.showinfo(
+                "Saved Offline",
+                f"{CONNECTION_LOST}.\n\nYour changes are saved on this computer and will be "
+                f"sent automatically when the connection returns."
+            )
+            self.current_page_data = {}
+            self.current_page_label.config(text="No page selected", fg="gray")
+            self.wysiwyg_editor.text.delete("1.0", tk.END)
+            self.html_editor.delete("1.0", tk.END)
+        elif success:
+            self.discard_draft()
             messagebox.showinfo("Success", message)
             self.current_page_data = {}
             self.current_page_label.config(text="No page selected", fg="gray")
@@ -1223,17 +4135,48 @@ class ConfluenceEditor(tk.Tk):
         
         self.update_btn.config(state="normal", text="💾 Update Page")
     
-    def generate_title(self):
-        """Generate automatic title"""
-        manager_name = self.manager_name_var.get().strip()
-        today = datetime.now().strftime("%d-%m-%Y")
+    def resolve_conflict(self, new_content, latest):
+        """Offer to merge with, or save on top of, a concurrent edit"""
+        if not latest:
+            messagebox.showerror("Error", f"{VERSION_CONFLICT}\n\nCould not load the latest version.")
+            return
         
-        if manager_name:
-            title = f"{today}_Handoff_{manager_name}"
+        title = self.current_page_data['title']
+        latest_version = latest['version']['number']
+        their_content = latest['body']['storage']['value']
+        merged = merge_storage(self.current_page_data['content'], new_content, their_content)
+        
+        if merged is not None:
+            choice = messagebox.askyesnocancel(
+                "Version Conflict",
+                f"'{title}' was changed by someone else (now version {latest_version}) "
+                f"while you were editing.\n\n"
+                f"Yes: merge your changes with theirs\n"
+                f"No: save your version on top of theirs\n"
+                f"Cancel: keep editing"
+            )
+            if choice is None:
+                return
+            content = merged if choice else new_content
         else:
-            title = f"{today}_Handoff"
+            if not messagebox.askyesno(
+                "Version Conflict",
+                f"'{title}' was changed by someone else (now version {latest_version}) "
+                f"in the same sections you edited, so it cannot be merged automatically.\n\n"
+                f"Save your version on top of theirs? Their changes will be overwritten."
+            ):
+                return
+            content = new_content
         
-        self.page_title_var.set(title)
+        # Their version becomes the new base for this edit
+        self.current_page_data['content'] = their_content
+        self.current_page_data['version'] = latest_version
+        self.save_page(content)
+    
+    def generate_title(self):
+        """Generate automatic title"""
+        manager_name = self.manager_name_var.get().strip()
+        self.page_title_var.set(handoff_title(datetime.now(), manager_name))
     
     def create_page(self):
         """Create a new page"""
@@ -1252,11 +4195,29 @@ class ConfluenceEditor(tk.Tk):
         # Create page
         self.create_page_btn.config(state="disabled", text="Creating...")
         self.create_status_label.config(text="Creating page...", fg="blue")
-        self.update()
         
-        success, message, page_id = self.client.create_daily_handoff_page(title, manager_name)
+        # Once sent, the page may already exist, so always report how it ended
+        self.tasks.submit(
+            self.client.create_daily_handoff_page, title, manager_name,
+            on_success=lambda result: self.show_create_result(result, title, manager_name),
+            on_error=lambda e: self.show_create_result((False, f"Error creating page: {e}", None)),
+            cancellable=False
+        )
+    
+    def show_create_result(self, result, title=None, manager_name=""):
+        """Report the outcome of a page creation"""
+        success, message, page_id = result
         
-        if success:
+        if message == CONNECTION_LOST and self.write_queue and title:
+            self.write_queue.add("create", title, manager_name=manager_name)
+            self.update_queue_status()
+            self.schedule_replay()
+            self.create_status_label.config(
+                text=f"📤 {CONNECTION_LOST} - '{title}' will be created when the connection returns",
+                fg="#e65100"
+            )
+            self.page_title_var.set("")
+        elif success:
             self.create_status_label.config(
                 text=f"✅ {message}",
                 fg="green"
@@ -1277,31 +4238,219 @@ class ConfluenceEditor(tk.Tk):
         
         self.create_page_btn.config(state="normal", text="📄 Create Page")
     
-    def delete_page(self, page_id, title):
-        """Delete a page"""
-        # Double confirmation for safety
-        if not messagebox.askyesno("Confirm Delete", 
-                                  f"Are you sure you want to delete:\n\n'{title}'?\n\nThis action cannot be undone!"):
+    def create_rota_pages(self):
+        """Create the handoff pages of a manager rota for a date range"""
+        try:
+            start = datetime.strptime(self.bulk_from_var.get().strip(), "%d-%m-%Y")
+            end = datetime.strptime(self.bulk_to_var.get().strip(), "%d-%m-%Y")
+        except ValueError:
+            messagebox.showwarning("Warning", "Dates must look like DD-MM-YYYY")
+            return
+        if end < start or (end - start).days >= BULK_MAX_DAYS:
+            messagebox.showwarning("Warning", f"Pick an end date after the start date, at most {BULK_MAX_DAYS} days later")
+            return
+        
+        rota = parse_rota(self.bulk_rota_text.get("1.0", tk.END))
+        plan = plan_rota(start, end, rota)
+        if not rota:
+            messagebox.showwarning("Warning", "Enter at least one manager")
+            return
+        if not plan:
+            messagebox.showwarning("Warning", "No manager in the rota works on any day of that date range")
+            return
+        
+        if not messagebox.askyesno(
+            "Confirm",
+            f"Create up to {len(plan)} handoff pages for {len({name for name, _ in rota})} manager(s) "
+            f"from {start:%d-%m-%Y} to {end:%d-%m-%Y}?\n\nPages that already exist are skipped."
+        ):
+            return
+        
+        results = []  # filled by the worker threads as pages are created
+        stop = threading.Event()
+        self.bulk_create_btn.config(state="disabled", text="Creating...")
+        self.bulk_results.delete("1.0", tk.END)
+        
+        def on_cancel():
+            # Pages already being created finish; the rest are skipped
+            stop.set()
+            self.show_rota_result(results, len(plan), "Cancelled")
+        
+        self.tasks.submit(
+            self.client.create_pages, plan, results, stop,
+            on_success=lambda done: self.show_rota_result(done, len(plan)),
+            on_error=lambda e: self.show_rota_result(results, len(plan), f"Error creating pages: {e}"),
+            on_cancel=on_cancel,
+            group="bulk_create"
+        )
+        self.show_rota_progress(results, len(plan))
+    
+    def show_rota_progress(self, results, total):
+        """Update the bulk creation status while pages are being created"""
+        if self.bulk_create_btn.cget("state") == "normal":
+            return
+        self.bulk_status_label.config(text=f"Creating pages... {len(results)} / {total} done", fg="blue")
+        self.after(250, lambda: self.show_rota_progress(results, total))
+    
+    def show_rota_result(self, results, total, error=None):
+        """Report each page of a bulk creation"""
+        icons = {"created": "✅", "exists": "➖", "failed": "❌", "cancelled": "✖"}
+        counts = {status: 0 for status in icons}
+        lines = []
+        for title, status, message, _ in sorted(list(results)):
+            counts[status] += 1
+            lines.append(f"{icons[status]} {title}: {message}")
+        
+        self.bulk_results.delete("1.0", tk.END)
+        self.bulk_results.insert("1.0", "\n".join(lines))
+        
+        summary = (f"{counts['created']} created, {counts['exists']} already existed, "
+                   f"{counts['failed']} failed, {counts['cancelled']} cancelled (of {total})")
+        if total and counts['exists'] == total:
+            summary = f"All {total} pages already exist - nothing to create"
+        if error:
+            summary = f"{error} - {summary}"
+        self.bulk_status_label.config(text=summary, fg="red" if error or counts['failed'] else "green")
+        self.bulk_create_btn.config(state="normal", text="📅 Create Rota Pages")
+        
+        if counts['created']:
+            self.refresh_type_ahead()
+    
+    def remove_selected_pages(self, action):
+        """Delete or archive the pages selected in the results list"""
+        pages = self.delete_results.selected_pages()
+        if not pages:
+            messagebox.showwarning("Warning", "Select one or more pages first")
+            return
+        self.remove_pages(pages, action)
+    
+    def remove_pages(self, pages, action):
+        """Confirm once, then delete or archive pages in the background"""
+        if self.delete_btn.cget("state") == "disabled":
+            messagebox.showwarning("Warning", "Pages are already being removed - wait or cancel first")
             return
         
-        if not messagebox.askyesno("Final Confirmation", 
-                                  "This is your last chance!\n\nReally delete this page?"):
+        dry_run = self.dry_run_var.get()
+        if not dry_run and not self.confirm_removal(pages, action):
             return
         
-        # Delete page
-        success, message = self.client.delete_page(page_id)
+        results = []  # filled by the worker threads as pages are removed
+        stop = threading.Event()
+        self.delete_btn.config(state="disabled")
+        self.archive_btn.config(state="disabled")
+        self.remove_results.delete("1.0", tk.END)
         
-        if success:
-            messagebox.showinfo("Success", message)
-            # Refresh the delete search results
-            self.search_pages_for_deletion()
+        def on_cancel():
+            # Requests already sent finish; the rest are skipped
+            stop.set()
+            self.show_remove_result(results, len(pages), "Cancelled")
+        
+        self.tasks.submit(
+            self.client.remove_pages, pages, action, results, stop, dry_run,
+            on_success=lambda done: self.show_remove_result(done, len(pages)),
+            on_error=lambda e: self.show_remove_result(results, len(pages), f"Error removing pages: {e}"),
+            on_cancel=on_cancel,
+            group="bulk_remove"
+        )
+        self.show_remove_progress(results, len(pages), action)
+    
+    def confirm_removal(self, pages, action):
+        """Ask once for a whole batch, listing every page affected"""
+        dialog = tk.Toplevel(self)
+        dialog.title("Confirm Delete" if action == "delete" else "Confirm Archive")
+        dialog.transient(self)
+        confirmed = tk.BooleanVar(value=False)
+        
+        if action == "delete":
+            text = f"Permanently delete these {len(pages)} page(s)? This cannot be undone!"
         else:
-            messagebox.showerror("Error", message)
+            text = f"Move these {len(pages)} page(s) under the archive page?"
+        tk.Label(dialog, text=text, font=("Arial", 11, "bold"),
+                 fg="#c62828" if action == "delete" else "black").pack(padx=10, pady=10)
+        
+        listing = scrolledtext.ScrolledText(dialog, height=min(20, len(pages) + 1), width=80, font=("Consolas", 9))
+        listing.insert("1.0", "\n".join(f"• {page['title']}" for page in pages))
+        listing.config(state="disabled")
+        listing.pack(fill="both", expand=True, padx=10)
+        
+        def close(answer):
+            confirmed.set(answer)
+            dialog.destroy()
+        
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(pady=10)
+        tk.Button(button_frame, text="Cancel", command=lambda: close(False)).pack(side="left", padx=5)
+        confirm_btn = tk.Button(
+            button_frame,
+            text=f"{'🗑️ Delete' if action == 'delete' else '📦 Archive'} {len(pages)} page(s)",
+            command=lambda: close(True),
+            bg="#f44336" if action == "delete" else "#FF9800",
+            fg="white"
+        )
+        confirm_btn.pack(side="left", padx=5)
+        
+        if action == "delete":
+            # Deleting cannot be undone, so the confirmation has to be typed
+            typed = tk.StringVar()
+            typed.trace_add(
+                "write",
+                lambda *_: confirm_btn.config(state="normal" if typed.get().strip() == "DELETE" else "disabled")
+            )
+            confirm_btn.config(state="disabled")
+            type_frame = tk.Frame(dialog)
+            type_frame.pack(before=button_frame, pady=(10, 0))
+            tk.Label(type_frame, text="Type DELETE to confirm:").pack(side="left", padx=5)
+            entry = tk.Entry(type_frame, textvariable=typed, width=12)
+            entry.pack(side="left")
+            entry.focus_set()
+        
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(False))
+        dialog.grab_set()
+        self.wait_window(dialog)
+        return confirmed.get()
+    
+    def show_remove_progress(self, results, total, action):
+        """Update the status while pages are being removed"""
+        if self.delete_btn.cget("state") == "normal":
+            return
+        verb = "Deleting" if action == "delete" else "Archiving"
+        self.remove_status_label.config(text=f"{verb} pages... {len(results)} / {total} done", fg="blue")
+        self.after(250, lambda: self.show_remove_progress(results, total, action))
+    
+    def show_remove_result(self, results, total, error=None):
+        """Report each page of a bulk delete or archive"""
+        icons = {"deleted": "🗑️", "archived": "📦", "would delete": "🔎", "would archive": "🔎",
+                 "failed": "❌", "cancelled": "✖"}
+        counts = {status: 0 for status in icons}
+        lines = []
+        for title, status, message in sorted(list(results)):
+            counts[status] += 1
+            lines.append(f"{icons[status]} {title}: {status if status.startswith('would') else message}")
+        
+        self.remove_results.delete("1.0", tk.END)
+        self.remove_results.insert("1.0", "\n".join(lines))
+        
+        summary = ", ".join(f"{count} {status}" for status, count in counts.items() if count) or "Nothing done"
+        summary = f"{summary} (of {total})"
+        if error:
+            summary = f"{error} - {summary}"
+        self.remove_status_label.config(text=summary, fg="red" if error or counts['failed'] else "green")
+        self.delete_btn.config(state="normal")
+        self.archive_btn.config(state="normal" if ARCHIVE_PAGE_ID else "disabled")
+        
+        if counts['deleted'] or counts['archived']:
+            # Drop the removed pages from the results
+            self.refresh_deletion_results()
     
     def view_page_content(self, page):
         """View page content in a popup"""
-        page_data = self.client.fetch_page_content(page['id'])
-        
+        self.tasks.submit(
+            self.client.fetch_page_content, page['id'], "view",
+            on_success=lambda page_data: self.show_page_popup(page, page_data)
+        )
+    
+    def show_page_popup(self, page, page_data):
+        """Show fetched page content in a popup"""
         if page_data:
             # Create popup window
             popup = tk.Toplevel(self)
@@ -1309,7 +4458,7 @@ class ConfluenceEditor(tk.Tk):
             popup.geometry("800x600")
             
             # Display content
-            html_view = HTMLLabel(popup, html=page_data['body']['view']['value'])
+            html_view = html_label(popup, html=page_data['body']['view']['value'])
             html_view.pack(fill="both", expand=True, padx=10, pady=10)
             
             # Buttons
@@ -1340,7 +4489,11 @@ class ConfluenceEditor(tk.Tk):
     
     def check_permissions(self):
         """Check and display permissions"""
-        self.has_write_permission = self.client.check_write_permission()
+        self.tasks.submit(self.client.check_write_permission, on_success=self.show_permissions)
+    
+    def show_permissions(self, has_write_permission):
+        """Display the result of the permission check"""
+        self.has_write_permission = has_write_permission
         
         if self.has_write_permission:
             self.status_label.config(
@@ -1352,43 +4505,229 @@ class ConfluenceEditor(tk.Tk):
                 text="❌ You dont have Write Permissiona",
                 fg="red"
             )
-
-
-def wait_for_internet(timeout=300, check_interval=5):
-    """Wait for internet connection"""
-    print("🌐 Checking internet connection...")
-    start = time.time()
     
-    while True:
-        try:
-            requests.get("https://www.google.com", timeout=5)
-            print("✅ Internet connection available.")
-            return True
-        except requests.RequestException:
-            if time.time() - start > timeout:
-                print("❌ Timeout: Internet still not available.")
-                return False
-            print("🌐 Waiting for internet connection...")
-            time.sleep(check_interval)
+    def show_busy(self, count):
+        """Show or hide the progress indicator for background work"""
+        self.progress_label.config(text=f"Working... ({count})")
+        if count and not self.busy_shown:
+            self.busy_shown = True
+            self.cancel_btn.pack(side="right", padx=5)
+            self.progress.pack(side="right", padx=5)
+            self.progress_label.pack(side="right")
+            self.progress.start(15)
+        elif not count and self.busy_shown:
+            self.busy_shown = False
+            self.progress.stop()
+            self.progress.pack_forget()
+            self.progress_label.pack_forget()
+            self.cancel_btn.pack_forget()
+    
+    def replay_queue(self):
+        """Send changes queued while offline, in the background"""
+        self.replay_job = None
+        if not self.write_queue or self.replaying or not self.write_queue.pending():
+            return
+        
+        failed_before = len(self.write_queue.failed())
+        
+        def on_done(sent):
+            self.replaying = False
+            self.update_queue_status()
+            if sent:
+                self.reconcile_index(self.refresh_type_ahead)
+            if len(self.write_queue.failed()) > failed_before:
+                self.show_queue_details()
+            self.schedule_replay()
+        
+        def on_stopped():
+            self.replaying = False
+            self.schedule_replay()
+        
+        def on_error(e):
+            print(f"⚠ Replaying queued changes failed: {e}")
+            on_stopped()
+        
+        self.replaying = True
+        self.tasks.submit(self.client.replay_queue, self.write_queue, on_success=on_done,
+                          on_error=on_error, on_cancel=on_stopped)
+    
+    def schedule_replay(self):
+        """Retry queued changes in QUEUE_RETRY_SECONDS while any are pending"""
+        if self.write_queue and self.write_queue.pending() and not self.replay_job:
+            self.replay_job = self.after(QUEUE_RETRY_SECONDS * 1000, self.replay_queue)
+    
+    def update_queue_status(self):
+        """Show how many changes are waiting to be sent or need attention"""
+        if not self.write_queue:
+            return
+        pending = len(self.write_queue.pending())
+        failed = len(self.write_queue.failed())
+        
+        if failed:
+            self.queue_label.config(text=f"⚠ {failed} queued change(s) need attention - click to review",
+                                    fg="#c62828")
+        elif pending:
+            self.queue_label.config(text=f"📤 {pending} change(s) waiting for Confluence", fg="#e65100")
+        else:
+            self.queue_label.config(text="")
+    
+    def show_queue_details(self):
+        """Let the user resolve queued changes Confluence rejected"""
+        if not self.write_queue:
+            return
+        
+        for entry in self.write_queue.failed():
+            if entry["kind"] == "update" and entry["error"] == VERSION_CONFLICT:
+                if messagebox.askyesno(
+                    "Queued Change Conflict",
+                    f"'{entry['title']}' was changed by someone else before your offline edit "
+                    f"from {entry['queued_at']} could be sent.\n\nOpen your edit to resolve it now?"
+                ):
+                    self.open_queued_conflict(entry)
+                    break
+            elif messagebox.askyesno(
+                "Queued Change Failed",
+                f"Your offline {entry['kind']} of '{entry['title']}' from {entry['queued_at']} "
+                f"failed: {entry['error']}\n\nDiscard it?"
+            ):
+                self.write_queue.finish(entry["id"])
+        
+        pending = self.write_queue.pending()
+        if pending and not self.write_queue.failed():
+            titles = "\n".join(f"• {entry['title']} ({entry['queued_at']})" for entry in pending)
+            messagebox.showinfo("Queued Changes", f"Waiting to be sent to Confluence:\n\n{titles}")
+        self.update_queue_status()
+    
+    def open_local_edit(self, page_id, title, content, base_content, base_version, note):
+        """Put an edit kept on this computer back into the editor, based on the version it started from"""
+        self.ensure_tab(self.search_frame)
+        self.notebook.select(self.search_frame)
+        self.autosave(reschedule=False)
+        
+        self.current_page_data = {
+            'id': page_id,
+            'title': title,
+            'content': base_content,
+            'version': base_version
+        }
+        self.current_page_label.config(text=f"Editing: {title} ({note})", fg="black")
+        if self.editor_mode.get() == "wysiwyg":
+            self.show_document(Document.from_storage(content))
+        else:
+            self.html_editor.delete("1.0", tk.END)
+            self.html_editor.insert("1.0", content)
+        self.update_btn.config(state="normal")
+    
+    def open_queued_conflict(self, entry):
+        """Load a conflicted offline edit into the editor and resolve it like a live conflict"""
+        self.open_local_edit(entry['page_id'], entry['title'], entry['content'],
+                             entry['base_content'], entry['base_version'], "offline edit")
+        
+        # The editor now holds the edit, so it leaves the queue
+        self.write_queue.finish(entry["id"])
+        self.update_queue_status()
+        
+        self.tasks.submit(
+            self.client.fetch_page_content, entry['page_id'], "storage",
+            on_success=lambda latest: self.resolve_conflict(entry['content'], latest)
+        )
+    
+    def autosave(self, reschedule=True):
+        """Save the page being edited as a draft if it changed since the last check.
+        
+        Only the widgets' modified flags are read here; serializing, diffing
+        and writing happen on the draft store's background thread.
+        """
+        if reschedule:
+            self.after(AUTOSAVE_SECONDS * 1000, self.autosave)
+        if not self.drafts or not self.current_page_data or not hasattr(self, "html_editor"):
+            return
+        
+        if self.editor_mode.get() == "wysiwyg":
+            text = self.wysiwyg_editor.text
+            if not text.edit_modified():
+                return
+            dump = text.dump("1.0", "end-1c", text=True, tag=True)
+            render = lambda: Document.from_editor_dump(dump).to_storage()
+        else:
+            if not self.html_editor.edit_modified():
+                return
+            content = self.html_editor.get("1.0", "end-1c").strip()
+            render = lambda: content
+        self.mark_editors_saved()
+        
+        page = self.current_page_data
+        self.drafts.save(page['id'], page['title'], page['version'], page['content'], render)
+    
+    def editors_modified(self):
+        """True if either editor has changes not yet autosaved"""
+        return bool(self.wysiwyg_editor.text.edit_modified() or self.html_editor.edit_modified())
+    
+    def mark_editors_saved(self):
+        """Clear the editors' modified flags"""
+        self.wysiwyg_editor.text.edit_modified(False)
+        self.html_editor.edit_modified(False)
+    
+    def discard_draft(self):
+        """Drop the autosaved draft of the page being edited"""
+        if self.drafts and self.current_page_data:
+            self.mark_editors_saved()
+            self.drafts.discard(self.current_page_data['id'])
+    
+    def offer_draft_recovery(self, drafts):
+        """Offer to restore drafts left by a previous session that did not save them"""
+        for draft in drafts:
+            choice = messagebox.askyesnocancel(
+                "Recover Unsaved Changes",
+                f"Unsaved changes to '{draft['title']}' (autosaved {draft['saved_at']}) were found.\n\n"
+                f"Yes: open them in the editor\n"
+                f"No: discard them\n"
+                f"Cancel: decide next time"
+            )
+            if choice is None:
+                continue
+            if not choice:
+                self.drafts.discard(draft['page_id'])
+                continue
+            
+            self.open_local_edit(draft['page_id'], draft['title'], draft['content'],
+                                 draft['base_content'], draft['base_version'], "recovered draft")
+            # Only one page can be edited at a time; the rest are offered next launch
+            break
+    
+    def cancel_tasks(self):
+        """Cancel all background work"""
+        self.tasks.cancel_all()
+    
+    def on_close(self):
+        """Drop pending work and close the window"""
+        self.autosave(reschedule=False)
+        self.tasks.shutdown()
+        # Waiting and retrying calls end now; calls already sent end within their read timeout
+        self.client.close()
+        if self.drafts:
+            self.drafts.close()
+        self.destroy()
 
 
 if __name__ == "__main__":
     try:
-        if wait_for_internet():
-            # Initialize Confluence client
-            client = ConfluenceClient(BASE_URL, PAGE_ID, PAT, VERIFY_SSL, SPACE_KEY)
-            
-            # Check current user
-            user = client.get_current_user()
-            if user:
-                print(f"✅ Authenticated as: {user.get('displayName', 'Unknown')}")
-            
-            # Launch GUI with manager name
-            app = ConfluenceEditor(client, MANAGER_NAME)
-            app.mainloop()
-        else:
-            print("❌ Could not connect to the internet after waiting.")
-            input("\nPress Enter to exit...")
+        # Initialize Confluence client with the local page index
+        index = PageIndex(INDEX_PATH)
+        client = ConfluenceClient(BASE_URL, PAGE_ID, PAT, VERIFY_SSL, SPACE_KEY, POOL_SIZE, USE_CQL,
+                                  index, CHILD_FETCH_WORKERS, CONTENT_CACHE_MB * 1024 * 1024)
+        mark_startup("client init")
+        
+        # Launch GUI with manager name; it connects and authenticates in the background
+        app = ConfluenceEditor(client, MANAGER_NAME, SnapshotStore(SNAPSHOT_PATH), WriteQueue(QUEUE_PATH),
+                               DraftStore(DRAFTS_DIR))
+        app.mainloop()
+        
+        stats = client.cache_stats()
+        print(f"📦 Page cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['entries']} entries ({stats['bytes'] // 1024} KB)")
+        client.close()
+        index.close()
     except Exception as e:
         print(f"\n❌ Error occurred: {e}")
         import traceback